@@ -1,7 +1,7 @@
 use crate::AppError;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
-use std::process::{Command, Stdio};
+use std::process::Stdio;
 use std::sync::Arc;
 use tokio::process::Child;
 use tokio::sync::Mutex;
@@ -86,6 +86,12 @@ impl ProcessManager {
             .stdin(Stdio::null())
             .kill_on_drop(true); // Ensure child is killed when dropped
 
+        // Put the child in its own process group so terminal signals
+        // (Ctrl-C on a dev run) don't propagate to managed nodes and miners;
+        // shutdown stays under our stop_process control.
+        #[cfg(unix)]
+        cmd.process_group(0);
+
         let child = cmd
             .spawn()
             .map_err(|e| AppError::Process(format!("Failed to start {name}: {e}")))?;
@@ -221,14 +227,32 @@ impl ProcessManager {
     }
 
     pub async fn list_processes(&self) -> Vec<ProcessInfo> {
+        use sysinfo::{Pid, System};
+
         let mut processes = self.processes.lock().await;
-        let mut result = Vec::new();
 
-        for (_name, process_info) in processes.iter_mut() {
-            // Update resource usage if process is running
+        // Refresh every running pid in one sysinfo pass instead of building
+        // a fresh System (and paying a process-table scan) per process.
+        let running_pids: Vec<Pid> = processes
+            .values()
+            .filter(|info| matches!(info.status, ProcessStatus::Running))
+            .map(|info| Pid::from(info.pid as usize))
+            .collect();
+
+        let mut system = System::new();
+        if !running_pids.is_empty() {
+            system.refresh_pids(&running_pids);
+        }
+
+        let mut result = Vec::with_capacity(processes.len());
+        for process_info in processes.values_mut() {
             if matches!(process_info.status, ProcessStatus::Running) {
-                if let Ok(usage) = self.get_process_resource_usage(process_info.pid).await {
-                    process_info.resource_usage = usage;
+                if let Some(process) = system.process(Pid::from(process_info.pid as usize)) {
+                    process_info.resource_usage = ResourceUsage {
+                        cpu_percent: process.cpu_usage() as f64,
+                        memory_mb: process.memory() / 1024 / 1024,
+                        uptime_seconds: process.run_time(),
+                    };
                 }
             }
             result.push(process_info.clone());
@@ -237,28 +261,6 @@ impl ProcessManager {
         result
     }
 
-    async fn get_process_resource_usage(&self, pid: ProcessId) -> Result<ResourceUsage, AppError> {
-        use sysinfo::{Pid, System};
-
-        let mut system = System::new();
-        let process_pid = Pid::from(pid as usize);
-        system.refresh_process(process_pid);
-
-        if let Some(process) = system.process(process_pid) {
-            Ok(ResourceUsage {
-                cpu_percent: process.cpu_usage() as f64,
-                memory_mb: process.memory() / 1024 / 1024,
-                uptime_seconds: process.run_time(),
-            })
-        } else {
-            Ok(ResourceUsage {
-                cpu_percent: 0.0,
-                memory_mb: 0,
-                uptime_seconds: 0,
-            })
-        }
-    }
-
     pub async fn cleanup_dead_processes(&self) -> Result<(), AppError> {
         let mut children = self.active_children.lock().await;
         let mut processes = self.processes.lock().await;
@@ -297,35 +299,317 @@ impl ProcessManager {
 
     #[allow(dead_code)]
     fn check_process_exists(&self, pid: ProcessId) -> bool {
-        #[cfg(unix)]
-        {
-            match Command::new("kill").args(["-0", &pid.to_string()]).output() {
-                Ok(output) => output.status.success(),
-                Err(_) => false,
+        // An in-process sysinfo lookup; forking `kill -0`/`tasklist` for
+        // this costs an exec per check on every platform.
+        use sysinfo::{Pid, System};
+
+        let mut system = System::new();
+        system.refresh_process(Pid::from(pid as usize))
+    }
+}
+
+// Global process manager instance
+static PROCESS_MANAGER: std::sync::OnceLock<ProcessManager> = std::sync::OnceLock::new();
+
+pub fn get_process_manager() -> &'static ProcessManager {
+    PROCESS_MANAGER.get_or_init(ProcessManager::new)
+}
+
+// Home directory resolved once at first use; dirs::home_dir() re-reads the
+// environment on every call, and a mid-run $HOME override should not move
+// our install and data directories around.
+static HOME_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+
+pub fn home_dir() -> Option<&'static Path> {
+    HOME_DIR.get_or_init(dirs::home_dir).as_deref()
+}
+
+// Well-known install and data directories under the home directory. These
+// never move during a run, so join them once instead of rebuilding the same
+// paths on every command.
+static BITCOIN_CORE_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+static WHIVE_CORE_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+static MINERS_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+static BITCOIN_DATA_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+
+fn home_subdir(
+    cell: &'static std::sync::OnceLock<Option<PathBuf>>,
+    name: &str,
+) -> Option<&'static Path> {
+    cell.get_or_init(|| home_dir().map(|home| home.join(name)))
+        .as_deref()
+}
+
+pub fn bitcoin_core_dir() -> Option<&'static Path> {
+    home_subdir(&BITCOIN_CORE_DIR, "bitcoin-core")
+}
+
+pub fn whive_core_dir() -> Option<&'static Path> {
+    home_subdir(&WHIVE_CORE_DIR, "whive-core")
+}
+
+pub fn miners_dir() -> Option<&'static Path> {
+    home_subdir(&MINERS_DIR, "melanin_miners")
+}
+
+pub fn bitcoin_data_dir() -> Option<&'static Path> {
+    home_subdir(&BITCOIN_DATA_DIR, ".bitcoin")
+}
+
+// Shared HTTP client so consecutive downloads reuse pooled connections
+// instead of paying a fresh TCP + TLS handshake per request.
+static HTTP_CLIENT: std::sync::OnceLock<reqwest::Client> = std::sync::OnceLock::new();
+
+pub fn http_client() -> &'static reqwest::Client {
+    HTTP_CLIENT.get_or_init(|| {
+        let timeout = crate::config::get_config().network_timeout_seconds;
+        reqwest::Client::builder()
+            .connect_timeout(std::time::Duration::from_secs(timeout))
+            // Keep a few warm connections per host so the terms fetch,
+            // node archive and miner archive can reuse them.
+            .pool_max_idle_per_host(4)
+            .build()
+            .unwrap_or_else(|_| reqwest::Client::new())
+    })
+}
+
+// Streaming downloads: one progress-tracked download loop shared by the
+// node and miner installers. Callers pick a sink (plain file or a tar
+// pipeline) and the helper owns registration, coalesced progress publishing
+// and the final "completed"/"failed" status, so no caller can forget the
+// failure path.
+
+fn download_error(msg: String) -> AppError {
+    AppError::Io(std::io::Error::other(msg))
+}
+
+/// Where the bytes of a streamed download end up.
+pub enum DownloadSink {
+    /// Buffered writes into a file, hashing the same bytes when a digest is
+    /// expected so integrity checking needs no second pass over the file.
+    File {
+        destination: PathBuf,
+        file: std::io::BufWriter<std::fs::File>,
+        checksum: Option<(sha2::Sha256, String)>,
+    },
+    /// Pipe into `tar -xzf -` so download and extraction overlap and no
+    /// intermediate archive ever touches the disk.
+    Tar {
+        child: Child,
+        stdin: Option<tokio::process::ChildStdin>,
+    },
+}
+
+impl DownloadSink {
+    pub fn file(destination: &Path, expected_sha256: Option<&str>) -> Result<Self, AppError> {
+        use sha2::Digest;
+        Ok(DownloadSink::File {
+            destination: destination.to_path_buf(),
+            // A 1 MiB buffer keeps the write syscall count low; network
+            // chunks arrive far smaller than that.
+            file: std::io::BufWriter::with_capacity(1 << 20, std::fs::File::create(destination)?),
+            checksum: expected_sha256.map(|expected| (sha2::Sha256::new(), expected.to_string())),
+        })
+    }
+
+    pub fn tar(extract_to: &Path) -> Result<Self, AppError> {
+        let mut child = tokio::process::Command::new("tar")
+            .arg("-xzf")
+            .arg("-")
+            .arg("-C")
+            .arg(extract_to)
+            .stdin(Stdio::piped())
+            .spawn()
+            .map_err(|e| download_error(format!("Failed to run tar: {}", e)))?;
+        let stdin = child
+            .stdin
+            .take()
+            .ok_or_else(|| download_error("Failed to open tar stdin".to_string()))?;
+        Ok(DownloadSink::Tar {
+            child,
+            stdin: Some(stdin),
+        })
+    }
+
+    async fn write_chunk(&mut self, chunk: &[u8]) -> Result<(), AppError> {
+        use sha2::Digest;
+        use tokio::io::AsyncWriteExt;
+        match self {
+            DownloadSink::File { file, checksum, .. } => {
+                std::io::Write::write_all(file, chunk)?;
+                if let Some((hasher, _)) = checksum.as_mut() {
+                    hasher.update(chunk);
+                }
+            }
+            DownloadSink::Tar { stdin, .. } => {
+                if let Some(stdin) = stdin.as_mut() {
+                    stdin
+                        .write_all(chunk)
+                        .await
+                        .map_err(|e| download_error(format!("Failed to extract: {}", e)))?;
+                }
             }
         }
+        Ok(())
+    }
 
-        #[cfg(windows)]
-        {
-            match Command::new("tasklist")
-                .args(&["/FI", &format!("PID eq {pid}")])
-                .output()
-            {
-                Ok(output) => {
-                    let stdout = String::from_utf8_lossy(&output.stdout);
-                    stdout.contains(&pid.to_string())
+    /// Flush/close the sink once the stream ends, verifying the checksum or
+    /// the tar exit status. A mismatched file is deleted before erroring.
+    async fn finish(self) -> Result<(), AppError> {
+        use sha2::Digest;
+        use tokio::io::AsyncWriteExt;
+        match self {
+            DownloadSink::File {
+                destination,
+                mut file,
+                checksum,
+            } => {
+                std::io::Write::flush(&mut file)?;
+                drop(file);
+                if let Some((hasher, expected)) = checksum {
+                    let digest = hex::encode(hasher.finalize());
+                    if !digest.eq_ignore_ascii_case(&expected) {
+                        let _ = std::fs::remove_file(&destination);
+                        return Err(download_error(format!(
+                            "Checksum mismatch for {}: expected {}, got {}",
+                            destination.display(),
+                            expected,
+                            digest
+                        )));
+                    }
+                }
+            }
+            DownloadSink::Tar { mut child, stdin } => {
+                if let Some(mut stdin) = stdin {
+                    stdin
+                        .shutdown()
+                        .await
+                        .map_err(|e| download_error(format!("Failed to extract: {}", e)))?;
+                }
+                let status = child
+                    .wait()
+                    .await
+                    .map_err(|e| download_error(format!("Failed to wait for tar: {}", e)))?;
+                if !status.success() {
+                    return Err(download_error(
+                        "tar exited with an error while extracting the download".to_string(),
+                    ));
                 }
-                Err(_) => false,
             }
         }
+        Ok(())
     }
 }
 
-// Global process manager instance
-static PROCESS_MANAGER: std::sync::OnceLock<ProcessManager> = std::sync::OnceLock::new();
+// Flip a registered download to "failed" so the UI poll never sees an
+// aborted transfer stuck on "downloading".
+async fn mark_download_failed(
+    downloads: &Mutex<HashMap<String, crate::DownloadProgress>>,
+    key: &str,
+) {
+    let mut downloads = downloads.lock().await;
+    if let Some(progress) = downloads.get_mut(key) {
+        progress.status = "failed".to_string();
+    }
+}
 
-pub fn get_process_manager() -> &'static ProcessManager {
-    PROCESS_MANAGER.get_or_init(ProcessManager::new)
+/// Stream `response` into `sink`, tracking progress in the shared downloads
+/// map under `key` (`url` is what the entry reports to pollers). The entry
+/// is registered up front so the UI can poll while the transfer runs,
+/// updated when the integer percentage advances or 250 ms have passed (the
+/// latter also covers responses without a Content-Length), and always left
+/// as "completed" or "failed" — never stuck on "downloading".
+pub async fn stream_download(
+    response: reqwest::Response,
+    mut sink: DownloadSink,
+    downloads: &Mutex<HashMap<String, crate::DownloadProgress>>,
+    key: &str,
+    url: &str,
+) -> Result<(), AppError> {
+    use futures_util::StreamExt;
+
+    let total_size = response.content_length().unwrap_or(0);
+    {
+        let mut downloads = downloads.lock().await;
+        downloads.insert(
+            key.to_string(),
+            crate::DownloadProgress {
+                total_size,
+                downloaded: 0,
+                speed: 0.0,
+                status: "downloading".to_string(),
+                url: url.to_string(),
+                started_at: chrono::Utc::now(),
+            },
+        );
+    }
+
+    let start_time = std::time::Instant::now();
+    const EMIT_INTERVAL: std::time::Duration = std::time::Duration::from_millis(250);
+
+    // The fallible section runs inside a block so any error marks the
+    // registered entry "failed" before propagating.
+    let stream_result: Result<u64, AppError> = async {
+        let mut downloaded: u64 = 0;
+        let mut last_percent: u64 = 0;
+        let mut last_emit = std::time::Instant::now();
+
+        let mut stream = response.bytes_stream();
+        while let Some(chunk) = stream.next().await {
+            let chunk = chunk.map_err(|e| download_error(format!("Download error: {}", e)))?;
+            sink.write_chunk(&chunk).await?;
+            downloaded += chunk.len() as u64;
+
+            let percent = if total_size > 0 {
+                downloaded * 100 / total_size
+            } else {
+                0
+            };
+            if percent > last_percent || last_emit.elapsed() >= EMIT_INTERVAL {
+                last_percent = percent;
+                last_emit = std::time::Instant::now();
+                let elapsed = start_time.elapsed().as_secs_f64();
+                let speed = if elapsed > 0.0 {
+                    downloaded as f64 / elapsed
+                } else {
+                    0.0
+                };
+                let mut downloads = downloads.lock().await;
+                if let Some(progress) = downloads.get_mut(key) {
+                    progress.downloaded = downloaded;
+                    progress.speed = speed;
+                }
+            }
+        }
+
+        sink.finish().await?;
+        Ok(downloaded)
+    }
+    .await;
+
+    let downloaded = match stream_result {
+        Ok(downloaded) => downloaded,
+        Err(e) => {
+            mark_download_failed(downloads, key).await;
+            return Err(e);
+        }
+    };
+
+    let elapsed = start_time.elapsed().as_secs_f64();
+    let speed = if elapsed > 0.0 {
+        downloaded as f64 / elapsed
+    } else {
+        0.0
+    };
+
+    let mut downloads = downloads.lock().await;
+    if let Some(progress) = downloads.get_mut(key) {
+        progress.downloaded = downloaded;
+        progress.speed = speed;
+        progress.status = "completed".to_string();
+    }
+
+    Ok(())
 }
 
 // Utility functions
@@ -336,18 +620,22 @@ pub async fn find_executable_in_path(
     fn search_recursive(dir: &Path, target: &str) -> Option<PathBuf> {
         if let Ok(entries) = std::fs::read_dir(dir) {
             for entry in entries.flatten() {
-                let path = entry.path();
-                if path.is_dir() {
-                    if let Some(found) = search_recursive(&path, target) {
+                // file_type() comes from the directory entry itself on most
+                // platforms, where path.is_dir() would stat every entry.
+                let Ok(file_type) = entry.file_type() else {
+                    continue;
+                };
+                if file_type.is_dir() {
+                    if let Some(found) = search_recursive(&entry.path(), target) {
                         return Some(found);
                     }
-                } else if path
+                } else if entry
                     .file_name()
-                    .and_then(|name| name.to_str())
+                    .to_str()
                     .map(|name| name.contains(target))
                     .unwrap_or(false)
                 {
-                    return Some(path);
+                    return Some(entry.path());
                 }
             }
         }
@@ -363,10 +651,60 @@ pub async fn find_executable_in_path(
     })
 }
 
-pub async fn ensure_directory_exists(path: &Path) -> Result<(), AppError> {
-    if !path.exists() {
-        std::fs::create_dir_all(path).map_err(AppError::Io)?;
+// Keys of installs currently in flight. Repeated clicks on an install
+// button must not start a second multi-hundred-MB download racing the first
+// into the same directory, so installers take a guard up front and bail out
+// while their key is held.
+static ACTIVE_INSTALLS: std::sync::OnceLock<
+    std::sync::Mutex<std::collections::HashSet<&'static str>>,
+> = std::sync::OnceLock::new();
+
+pub struct InstallGuard(&'static str);
+
+pub fn try_begin_install(key: &'static str) -> Option<InstallGuard> {
+    let active = ACTIVE_INSTALLS.get_or_init(Default::default);
+    let mut active = active.lock().ok()?;
+    if active.insert(key) {
+        Some(InstallGuard(key))
+    } else {
+        None
+    }
+}
+
+impl Drop for InstallGuard {
+    fn drop(&mut self) {
+        if let Some(active) = ACTIVE_INSTALLS.get() {
+            if let Ok(mut active) = active.lock() {
+                active.remove(self.0);
+            }
+        }
     }
+}
+
+// "Can this be launched?" in one metadata call: the same stat that answers
+// exists() also carries the mode bits, so checking the execute bit here is
+// free and rejects non-executable candidates before a doomed spawn.
+pub fn is_executable(path: &Path) -> bool {
+    match std::fs::metadata(path) {
+        Ok(metadata) if metadata.is_file() => {
+            #[cfg(unix)]
+            {
+                use std::os::unix::fs::PermissionsExt;
+                metadata.permissions().mode() & 0o111 != 0
+            }
+            #[cfg(not(unix))]
+            {
+                true
+            }
+        }
+        _ => false,
+    }
+}
+
+pub async fn ensure_directory_exists(path: &Path) -> Result<(), AppError> {
+    // create_dir_all already succeeds when the directory exists; a prior
+    // exists() check just adds a stat syscall and a lookup race.
+    std::fs::create_dir_all(path).map_err(AppError::Io)?;
     Ok(())
 }
 
@@ -374,10 +712,235 @@ pub async fn set_executable_permissions(path: &Path) -> Result<(), AppError> {
     #[cfg(unix)]
     {
         use std::os::unix::fs::PermissionsExt;
+
+        // Walk directories using the metadata cached in the directory entry,
+        // and only chmod files whose bits actually differ: a read of cached
+        // stat data is cheaper than an unconditional inode write, and on a
+        // re-run over an installed tree every file is already 0o755.
+        fn chmod_dir_contents(dir: &Path) -> std::io::Result<()> {
+            for entry in std::fs::read_dir(dir)?.flatten() {
+                let Ok(metadata) = entry.metadata() else {
+                    continue;
+                };
+                if metadata.is_dir() {
+                    chmod_dir_contents(&entry.path())?;
+                } else if metadata.is_file() && metadata.permissions().mode() & 0o755 != 0o755 {
+                    std::fs::set_permissions(
+                        &entry.path(),
+                        std::fs::Permissions::from_mode(0o755),
+                    )?;
+                }
+            }
+            Ok(())
+        }
+
         let metadata = std::fs::metadata(path)?;
-        let mut perms = metadata.permissions();
-        perms.set_mode(0o755);
-        std::fs::set_permissions(path, perms)?;
+        if metadata.is_dir() {
+            chmod_dir_contents(path)?;
+        } else if metadata.permissions().mode() & 0o755 != 0o755 {
+            let mut perms = metadata.permissions();
+            perms.set_mode(0o755);
+            std::fs::set_permissions(path, perms)?;
+        }
+    }
+    Ok(())
+}
+
+// Archive extraction shared by the node and miner installers. Failures
+// surface as IO errors; the callers add their own context.
+fn archive_error(msg: String) -> AppError {
+    AppError::Io(std::io::Error::other(msg))
+}
+
+pub async fn extract_tarball(archive_path: &Path, extract_to: &Path) -> Result<(), AppError> {
+    extract_tarball_filtered(archive_path, extract_to, None).await
+}
+
+// entry_filter, when given, decides which members the in-process fallback
+// unpacks; the pigz/system-tar fast paths always extract everything, so a
+// filter is an optimization hint, never a guarantee. Callers that need every
+// member (miner tarballs with no fixed layout) must pass None.
+pub async fn extract_tarball_filtered(
+    archive_path: &Path,
+    extract_to: &Path,
+    entry_filter: Option<fn(&Path) -> bool>,
+) -> Result<(), AppError> {
+    // Best case: pigz decompresses gzip blocks across all cores, with tar
+    // consuming the decoded stream. Falls back to plain tar below.
+    if cfg!(unix) && which::which("pigz").is_ok() && which::which("tar").is_ok() {
+        if let Ok(()) = extract_tarball_pigz(archive_path, extract_to).await {
+            return Ok(());
+        }
+    }
+
+    // Prefer the system tar binary when available: the C implementation
+    // streams large archives noticeably faster than the in-process decoder.
+    if cfg!(unix) && which::which("tar").is_ok() {
+        let status = tokio::process::Command::new("tar")
+            .arg("-xzf")
+            .arg(archive_path)
+            .arg("-C")
+            .arg(extract_to)
+            .status()
+            .await
+            .map_err(|e| archive_error(format!("Failed to run tar: {}", e)))?;
+        if status.success() {
+            return Ok(());
+        }
+        // Fall through to the built-in extractor if tar rejected the archive
+    }
+
+    let file = std::fs::File::open(archive_path)?;
+    let tar = flate2::read::GzDecoder::new(file);
+    let mut archive = tar::Archive::new(tar);
+    // Skip mtime/permission restoration per member; install() chmods the
+    // binaries explicitly afterwards so those syscalls are pure overhead.
+    archive.set_preserve_mtime(false);
+    archive.set_preserve_permissions(false);
+    // Unpack entry by entry so the bin/ directory can be noted from the tar
+    // header stream itself, sparing the executable lookup a post-extraction
+    // scan of the whole tree. When the caller supplied a filter, members it
+    // rejects are skipped entirely; nothing reads them, so decoding their
+    // bytes is the only cost worth paying.
+    for entry in archive
+        .entries()
+        .map_err(|e| archive_error(format!("Failed to read archive: {}", e)))?
+    {
+        let mut entry = entry.map_err(|e| archive_error(format!("Failed to extract: {}", e)))?;
+        let path = entry
+            .path()
+            .map_err(|e| archive_error(format!("Failed to extract: {}", e)))?
+            .into_owned();
+        if entry_filter.map(|keep| !keep(&path)).unwrap_or(false) {
+            continue;
+        }
+        record_extracted_bin_dir(extract_to, &path);
+        entry
+            .unpack_in(extract_to)
+            .map_err(|e| archive_error(format!("Failed to extract: {}", e)))?;
+    }
+    Ok(())
+}
+
+// Bin directories observed while unpacking archives in-process, keyed by the
+// extraction root. The system-tar fast paths do not populate this; the known
+// layout probe covers those installs.
+static EXTRACTED_BIN_DIRS: std::sync::OnceLock<
+    std::sync::Mutex<std::collections::HashMap<PathBuf, PathBuf>>,
+> = std::sync::OnceLock::new();
+
+fn record_extracted_bin_dir(extract_root: &Path, entry_path: &Path) {
+    let mut prefix = PathBuf::new();
+    for component in entry_path.components() {
+        prefix.push(component);
+        if component.as_os_str() == "bin" {
+            let cache = EXTRACTED_BIN_DIRS.get_or_init(Default::default);
+            if let Ok(mut cache) = cache.lock() {
+                cache
+                    .entry(extract_root.to_path_buf())
+                    .or_insert_with(|| extract_root.join(&prefix));
+            }
+            return;
+        }
+    }
+}
+
+pub fn cached_bin_dir(extract_root: &Path) -> Option<PathBuf> {
+    let cache = EXTRACTED_BIN_DIRS.get()?;
+    let cache = cache.lock().ok()?;
+    cache.get(extract_root).cloned()
+}
+
+// `pigz -dc archive | tar -xf - -C dest`: parallel gzip decode piped into tar.
+async fn extract_tarball_pigz(archive_path: &Path, extract_to: &Path) -> Result<(), AppError> {
+    let mut pigz = tokio::process::Command::new("pigz")
+        .arg("-dc")
+        .arg(archive_path)
+        .stdout(std::process::Stdio::piped())
+        .spawn()
+        .map_err(|e| archive_error(format!("Failed to run pigz: {}", e)))?;
+
+    let pigz_stdout = pigz
+        .stdout
+        .take()
+        .ok_or_else(|| archive_error("Failed to capture pigz output".to_string()))?;
+    let pigz_stdout: std::process::Stdio = pigz_stdout
+        .try_into()
+        .map_err(|e| archive_error(format!("Failed to pipe pigz output: {}", e)))?;
+
+    let tar_status = tokio::process::Command::new("tar")
+        .arg("-xf")
+        .arg("-")
+        .arg("-C")
+        .arg(extract_to)
+        .stdin(pigz_stdout)
+        .status()
+        .await
+        .map_err(|e| archive_error(format!("Failed to run tar: {}", e)))?;
+
+    let pigz_status = pigz
+        .wait()
+        .await
+        .map_err(|e| archive_error(format!("Failed to wait for pigz: {}", e)))?;
+
+    if tar_status.success() && pigz_status.success() {
+        Ok(())
+    } else {
+        Err(archive_error(
+            "pigz | tar pipeline exited with an error".to_string(),
+        ))
+    }
+}
+
+pub async fn extract_zip(archive_path: &Path, extract_to: &Path) -> Result<(), AppError> {
+    // Same fast path as extract_tarball: hand the work to the system unzip
+    // binary when present and fall back to the zip crate otherwise.
+    if cfg!(unix) && which::which("unzip").is_ok() {
+        let status = tokio::process::Command::new("unzip")
+            .arg("-o")
+            .arg("-q")
+            .arg(archive_path)
+            .arg("-d")
+            .arg(extract_to)
+            .status()
+            .await
+            .map_err(|e| archive_error(format!("Failed to run unzip: {}", e)))?;
+        if status.success() {
+            return Ok(());
+        }
+    }
+
+    let file = std::fs::File::open(archive_path)?;
+    let mut archive = zip::ZipArchive::new(file)
+        .map_err(|e| archive_error(format!("Failed to open zip: {}", e)))?;
+
+    for i in 0..archive.len() {
+        let mut file = archive
+            .by_index(i)
+            .map_err(|e| archive_error(format!("Failed to read zip entry: {}", e)))?;
+        let outpath = match file.enclosed_name() {
+            Some(path) => extract_to.join(path),
+            None => continue,
+        };
+
+        if file.name().ends_with('/') {
+            std::fs::create_dir_all(&outpath)?;
+        } else {
+            if let Some(p) = outpath.parent() {
+                std::fs::create_dir_all(p)?;
+            }
+            let mut outfile = std::fs::File::create(&outpath)?;
+            std::io::copy(&mut file, &mut outfile)?;
+        }
+
+        // Set permissions on Unix
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::PermissionsExt;
+            if let Some(mode) = file.unix_mode() {
+                std::fs::set_permissions(&outpath, std::fs::Permissions::from_mode(mode))?;
+            }
+        }
     }
     Ok(())
 }
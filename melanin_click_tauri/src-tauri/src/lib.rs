@@ -165,6 +165,7 @@ fn main() {
         .manage(android_lifecycle::AndroidLifecycleManager::new())
         .setup(|_app| {
             // Perform additional setup here
+            node::prime_download_connections();
             tracing::info!("Tauri application setup complete");
             Ok(())
         })
@@ -199,6 +200,7 @@ fn main() {
             validation::verify_file_hash,
             // Utility commands
             utils::get_download_progress,
+            utils::get_active_downloads,
             utils::check_file_exists,
             utils::create_directory,
             utils::get_file_size,
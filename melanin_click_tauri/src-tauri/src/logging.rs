@@ -5,6 +5,12 @@ use std::path::PathBuf;
 use tracing::Level;
 use tracing_subscriber::{fmt, layer::SubscriberExt, util::SubscriberInitExt, EnvFilter};
 
+// The non_blocking writer's guard owns the background worker that drains
+// log lines to disk; dropping it silences file logging, so it lives for the
+// process.
+static FILE_GUARD: std::sync::OnceLock<tracing_appender::non_blocking::WorkerGuard> =
+    std::sync::OnceLock::new();
+
 pub fn init_logging() -> Result<(), AppError> {
     let config = get_config();
 
@@ -38,7 +44,8 @@ pub fn init_logging() -> Result<(), AppError> {
             .unwrap_or(std::ffi::OsStr::new("melanin_click.log")),
     );
 
-    let (file_writer, _file_guard) = tracing_appender::non_blocking(file_appender);
+    let (file_writer, file_guard) = tracing_appender::non_blocking(file_appender);
+    let _ = FILE_GUARD.set(file_guard);
 
     // Configure console and file layers
     let console_layer = fmt::layer()
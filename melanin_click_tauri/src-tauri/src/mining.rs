@@ -1,6 +1,6 @@
 use crate::core::{find_executable_in_path, get_process_manager};
 use crate::mining_stats::MINING_STATS;
-use crate::validation::{validate_bitcoin_address, validate_whive_address};
+use crate::validation::{is_valid_bitcoin_address, is_valid_whive_address};
 use crate::{AppError, AppState, MiningConfig, MiningStats};
 use serde::{Deserialize, Serialize};
 use std::path::Path;
@@ -41,15 +41,14 @@ pub struct MiningSession {
 // Download and install mining executables
 #[tauri::command]
 pub async fn download_and_install_miners(state: State<'_, AppState>) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
+    let _install_guard = crate::core::try_begin_install("miners")
+        .ok_or_else(|| AppError::Mining("Miner installation is already in progress".to_string()))?;
+    let miners_dir = crate::core::miners_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
-
-    // Create miners directory
-    let miners_dir = home_dir.join("melanin_miners");
-    crate::core::ensure_directory_exists(&miners_dir).await?;
+    crate::core::ensure_directory_exists(miners_dir).await?;
 
     // Download cpuminer-multi for Whive Yespower mining
-    let miner_download = get_cpuminer_download_url().await?;
+    let miner_download = get_cpuminer_download_url()?;
     let cpuminer_filename = miner_download
         .url
         .split('/')
@@ -79,20 +78,34 @@ pub async fn download_and_install_miners(state: State<'_, AppState>) -> Result<S
 
         // Extract if it's an archive
         if cpuminer_filename.ends_with(".tar.gz") {
-            extract_tarball(&cpuminer_path, &miners_dir).await?;
+            crate::core::extract_tarball(&cpuminer_path, &miners_dir).await?;
             std::fs::remove_file(&cpuminer_path)?;
         } else if cpuminer_filename.ends_with(".zip") {
-            extract_zip(&cpuminer_path, &miners_dir).await?;
+            crate::core::extract_zip(&cpuminer_path, &miners_dir).await?;
             std::fs::remove_file(&cpuminer_path)?;
         }
 
         // Set executable permissions
         crate::core::set_executable_permissions(&miners_dir).await?;
+
+        // A stale cached path (say, an old system minerd found on PATH)
+        // must not shadow the binaries that were just installed.
+        invalidate_miner_caches();
     }
 
     Ok("Mining executables installed successfully".to_string())
 }
 
+fn invalidate_miner_caches() {
+    for cache in [&MINER_PATH, &CGMINER_PATH] {
+        if let Some(cache) = cache.get() {
+            if let Ok(mut cached) = cache.lock() {
+                *cached = None;
+            }
+        }
+    }
+}
+
 // Known checksums for mining software verification
 struct MinerDownload {
     url: String,
@@ -100,7 +113,7 @@ struct MinerDownload {
 }
 
 // Get the correct cpuminer download URL and checksum for the platform
-async fn get_cpuminer_download_url() -> Result<MinerDownload, AppError> {
+fn get_cpuminer_download_url() -> Result<MinerDownload, AppError> {
     let os = std::env::consts::OS;
     let arch = std::env::consts::ARCH;
 
@@ -133,7 +146,7 @@ async fn download_file_internal(
     path: &std::path::Path,
     state: &State<'_, AppState>,
 ) -> Result<(), AppError> {
-    let client = reqwest::Client::new();
+    let client = crate::core::http_client();
     let response = client
         .get(url)
         .send()
@@ -147,107 +160,12 @@ async fn download_file_internal(
         )));
     }
 
-    let total_size = response.content_length().unwrap_or(0);
-    let bytes = response
-        .bytes()
-        .await
-        .map_err(|e| AppError::Mining(format!("Failed to read response bytes: {e}")))?;
-
-    // Track download progress
+    // Miner downloads are registered under the archive's filename rather
+    // than the full URL; the shared helper handles progress and the final
+    // completed/failed status.
     let download_id = url.split('/').next_back().unwrap_or("download").to_string();
-    {
-        let mut downloads = state.downloads.lock().await;
-        downloads.insert(
-            download_id.clone(),
-            crate::DownloadProgress {
-                total_size,
-                downloaded: 0,
-                speed: 0.0,
-                status: "Downloading".to_string(),
-                url: url.to_string(),
-                started_at: chrono::Utc::now(),
-            },
-        );
-    }
-
-    // Write file
-    tokio::fs::write(path, &bytes).await?;
-
-    // Mark as completed
-    {
-        let mut downloads = state.downloads.lock().await;
-        if let Some(progress) = downloads.get_mut(&download_id) {
-            progress.downloaded = bytes.len() as u64;
-            progress.status = "Completed".to_string();
-        }
-    }
-
-    Ok(())
-}
-
-// Extract tar.gz files
-async fn extract_tarball(
-    archive_path: &std::path::Path,
-    extract_to: &std::path::Path,
-) -> Result<(), AppError> {
-    use flate2::read::GzDecoder;
-    use tar::Archive;
-
-    let file = std::fs::File::open(archive_path)?;
-    let gz_decoder = GzDecoder::new(file);
-    let mut archive = Archive::new(gz_decoder);
-
-    archive
-        .unpack(extract_to)
-        .map_err(|e| AppError::Mining(format!("Failed to extract tarball: {e}")))?;
-
-    Ok(())
-}
-
-// Extract zip files
-async fn extract_zip(
-    archive_path: &std::path::Path,
-    extract_to: &std::path::Path,
-) -> Result<(), AppError> {
-    let file = std::fs::File::open(archive_path)?;
-    let mut archive = zip::ZipArchive::new(file)
-        .map_err(|e| AppError::Mining(format!("Failed to open zip: {e}")))?;
-
-    for i in 0..archive.len() {
-        let mut file = archive
-            .by_index(i)
-            .map_err(|e| AppError::Mining(format!("Failed to read zip entry: {e}")))?;
-
-        let outpath = match file.enclosed_name() {
-            Some(path) => extract_to.join(path),
-            None => continue,
-        };
-
-        if file.name().ends_with('/') {
-            std::fs::create_dir_all(&outpath)?;
-        } else {
-            if let Some(p) = outpath.parent() {
-                if !p.exists() {
-                    std::fs::create_dir_all(p)?;
-                }
-            }
-            let mut outfile = std::fs::File::create(&outpath)?;
-            std::io::copy(&mut file, &mut outfile)?;
-        }
-
-        // Set executable permissions on Unix
-        #[cfg(unix)]
-        {
-            use std::os::unix::fs::PermissionsExt;
-            if !file.name().ends_with('/') {
-                let mut perms = std::fs::metadata(&outpath)?.permissions();
-                perms.set_mode(0o755);
-                std::fs::set_permissions(&outpath, perms)?;
-            }
-        }
-    }
-
-    Ok(())
+    let sink = crate::core::DownloadSink::file(path, None)?;
+    crate::core::stream_download(response, sink, &state.downloads, &download_id, url).await
 }
 
 // Enhanced Whive Mining with actual executable download
@@ -260,7 +178,7 @@ pub async fn start_enhanced_whive_mining(
     _state: State<'_, AppState>,
 ) -> Result<String, AppError> {
     // Validate address
-    if !validate_whive_address(whive_address.clone()).await? {
+    if !is_valid_whive_address(&whive_address) {
         return Err(AppError::Validation(
             "Invalid Whive address format".to_string(),
         ));
@@ -275,11 +193,10 @@ pub async fn start_enhanced_whive_mining(
     }
 
     // Ensure miners are installed
-    let home_dir = dirs::home_dir()
+    let miners_dir = crate::core::miners_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
-    let miners_dir = home_dir.join("melanin_miners");
 
-    let miner_path = find_miner_executable(&miners_dir).await?;
+    let miner_path = find_miner_executable(miners_dir).await?;
 
     // Setup mining parameters following the exact Whive pool example
     let num_threads = threads.unwrap_or(2); // Default to 2 threads as in example
@@ -334,7 +251,7 @@ pub async fn start_enhanced_bitcoin_mining(
     state: State<'_, AppState>,
 ) -> Result<String, AppError> {
     // Validate address
-    if !validate_bitcoin_address(bitcoin_address.clone()).await? {
+    if !is_valid_bitcoin_address(&bitcoin_address) {
         return Err(AppError::Validation(
             "Invalid Bitcoin address format".to_string(),
         ));
@@ -369,11 +286,9 @@ async fn start_bitcoin_cpu_mining(
     state: State<'_, AppState>,
 ) -> Result<String, AppError> {
     // Find miner executable
-    let home_dir = dirs::home_dir()
+    let miners_dir = crate::core::miners_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
-
-    let miners_dir = home_dir.join("melanin_miners");
-    let miner_path = find_miner_executable(&miners_dir).await?;
+    let miner_path = find_miner_executable(miners_dir).await?;
 
     // Enhanced pool selection with the exact example format
     let (pool_url, pool_description) = match pool_name.as_str() {
@@ -472,7 +387,7 @@ async fn start_bitcoin_stick_mining(
     state: State<'_, AppState>,
 ) -> Result<String, AppError> {
     // Check for cgminer installation
-    let home_dir = dirs::home_dir()
+    let home_dir = crate::core::home_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
 
     let cgminer_path = find_cgminer_executable(&home_dir).await?;
@@ -597,6 +512,11 @@ pub async fn get_mining_status(
     }
 }
 
+// Serialized form of the last config written (or read) this session, so
+// repeated saves compare against memory instead of re-reading the file.
+static MINING_CONFIG_JSON: std::sync::OnceLock<std::sync::Mutex<Option<String>>> =
+    std::sync::OnceLock::new();
+
 // Update Mining Configuration
 #[tauri::command]
 pub async fn update_mining_config(
@@ -604,7 +524,7 @@ pub async fn update_mining_config(
     _state: State<'_, AppState>,
 ) -> Result<String, AppError> {
     // Save configuration to file
-    let home_dir = dirs::home_dir()
+    let home_dir = crate::core::home_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
     let config_dir = home_dir.join(".melanin_click");
 
@@ -614,7 +534,24 @@ pub async fn update_mining_config(
     let config_json = serde_json::to_string_pretty(&config)
         .map_err(|e| AppError::Mining(format!("Failed to serialize config: {e}")))?;
 
-    std::fs::write(&config_file, config_json)?;
+    // Skip the write when nothing changed, and go through a temp file +
+    // rename otherwise so a crash mid-write can never leave a torn config.
+    let cache = MINING_CONFIG_JSON.get_or_init(Default::default);
+    let cached = cache.lock().ok().and_then(|c| c.clone());
+    let existing = match cached {
+        Some(cached) => Some(cached),
+        None => std::fs::read_to_string(&config_file).ok(),
+    };
+    if existing.as_deref() == Some(config_json.as_str()) {
+        return Ok("Mining configuration unchanged".to_string());
+    }
+
+    let tmp_file = config_dir.join("mining_config.json.tmp");
+    std::fs::write(&tmp_file, &config_json)?;
+    std::fs::rename(&tmp_file, &config_file)?;
+    if let Ok(mut cached) = cache.lock() {
+        *cached = Some(config_json);
+    }
 
     Ok("Mining configuration updated successfully".to_string())
 }
@@ -707,14 +644,42 @@ pub async fn get_mining_pools() -> Result<Vec<MiningPool>, AppError> {
 }
 
 // Helper functions
+
+// Last resolved miner path. Each hit is re-validated with exists(), so
+// removing the binaries triggers a fresh search; repeat launches skip the
+// directory probing and PATH walk entirely.
+static MINER_PATH: std::sync::OnceLock<std::sync::Mutex<Option<std::path::PathBuf>>> =
+    std::sync::OnceLock::new();
+
 async fn find_miner_executable(miners_dir: &Path) -> Result<std::path::PathBuf, AppError> {
-    // Try different miner executable names
+    let cache = MINER_PATH.get_or_init(Default::default);
+    if let Ok(cached) = cache.lock() {
+        if let Some(path) = cached.as_ref() {
+            if path.exists() {
+                return Ok(path.clone());
+            }
+        }
+    }
+
+    let resolved = resolve_miner_executable(miners_dir)?;
+    if let Ok(mut cached) = cache.lock() {
+        *cached = Some(resolved.clone());
+    }
+    Ok(resolved)
+}
+
+fn resolve_miner_executable(miners_dir: &Path) -> Result<std::path::PathBuf, AppError> {
+    use crate::core::is_executable;
+
+    // Try different miner executable names. is_executable answers "can this
+    // be launched" in the same stat that exists() would cost, and skips
+    // entries that would fail at spawn time anyway.
     let possible_names = vec!["cpuminer-multi", "cpuminer", "minerd"];
 
     for name in possible_names {
         // Check in miners directory first
         let exe_path = miners_dir.join(name);
-        if exe_path.exists() {
+        if is_executable(&exe_path) {
             return Ok(exe_path);
         }
 
@@ -722,7 +687,7 @@ async fn find_miner_executable(miners_dir: &Path) -> Result<std::path::PathBuf,
         #[cfg(windows)]
         {
             let exe_path_win = miners_dir.join(format!("{}.exe", name));
-            if exe_path_win.exists() {
+            if is_executable(&exe_path_win) {
                 return Ok(exe_path_win);
             }
         }
@@ -732,14 +697,14 @@ async fn find_miner_executable(miners_dir: &Path) -> Result<std::path::PathBuf,
             for entry in entries.flatten() {
                 if entry.file_type().map(|ft| ft.is_dir()).unwrap_or(false) {
                     let sub_exe = entry.path().join(name);
-                    if sub_exe.exists() {
+                    if is_executable(&sub_exe) {
                         return Ok(sub_exe);
                     }
 
                     #[cfg(windows)]
                     {
                         let sub_exe_win = entry.path().join(format!("{}.exe", name));
-                        if sub_exe_win.exists() {
+                        if is_executable(&sub_exe_win) {
                             return Ok(sub_exe_win);
                         }
                     }
@@ -760,7 +725,29 @@ async fn find_miner_executable(miners_dir: &Path) -> Result<std::path::PathBuf,
     ))
 }
 
+// Last resolved cgminer path, revalidated like MINER_PATH above so repeat
+// stick-mining starts skip the directory walk and PATH probe.
+static CGMINER_PATH: std::sync::OnceLock<std::sync::Mutex<Option<std::path::PathBuf>>> =
+    std::sync::OnceLock::new();
+
 async fn find_cgminer_executable(base_path: &Path) -> Result<std::path::PathBuf, AppError> {
+    let cache = CGMINER_PATH.get_or_init(Default::default);
+    if let Ok(cached) = cache.lock() {
+        if let Some(path) = cached.as_ref() {
+            if path.exists() {
+                return Ok(path.clone());
+            }
+        }
+    }
+
+    let resolved = resolve_cgminer_executable(base_path).await?;
+    if let Ok(mut cached) = cache.lock() {
+        *cached = Some(resolved.clone());
+    }
+    Ok(resolved)
+}
+
+async fn resolve_cgminer_executable(base_path: &Path) -> Result<std::path::PathBuf, AppError> {
     // Look for cgminer for stick mining
     if let Ok(path) = find_executable_in_path(base_path, "cgminer").await {
         return Ok(path);
@@ -784,11 +771,9 @@ pub async fn test_simple_mining(
     algorithm: String,
     threads: u32,
 ) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
+    let miners_dir = crate::core::miners_dir()
         .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
-
-    let miners_dir = home_dir.join("melanin_miners");
-    let miner_path = find_miner_executable(&miners_dir).await?;
+    let miner_path = find_miner_executable(miners_dir).await?;
 
     let user_string = format!("{}.worker", address);
     let threads_str = threads.to_string();
@@ -816,32 +801,79 @@ pub async fn test_simple_mining(
     ))
 }
 
+// Probe the known minerd locations once, in the same order the Python app
+// used: whive-core's bundled miner first, then the melanin_miners directory.
+// Each candidate costs a single stat and the winner is returned directly,
+// instead of both simple-mining commands duplicating the chain and
+// re-checking the final candidate.
+fn find_simple_minerd() -> Result<std::path::PathBuf, AppError> {
+    let whive_core_dir = crate::core::whive_core_dir()
+        .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
+    let miners_dir = crate::core::miners_dir()
+        .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
+
+    let candidates = [
+        whive_core_dir.join("whive/miner/minerd"),
+        miners_dir.join("minerd"),
+        miners_dir.join("cpuminer-multi"),
+    ];
+    candidates
+        .into_iter()
+        .find(|path| crate::core::is_executable(path))
+        .ok_or_else(|| {
+            AppError::Mining(
+                "Miner not found. Please install mining executables first.".to_string(),
+            )
+        })
+}
+
+// Quote a string as an AppleScript literal. Backslash and double quote are
+// the only characters AppleScript escapes inside string constants; without
+// this, a crafted address would splice arbitrary script into `do script`.
+fn applescript_string(s: &str) -> String {
+    let mut quoted = String::with_capacity(s.len() + 2);
+    quoted.push('"');
+    for c in s.chars() {
+        if c == '"' || c == '\\' {
+            quoted.push('\\');
+        }
+        quoted.push(c);
+    }
+    quoted.push('"');
+    quoted
+}
+
 // Simple mining functions that open Terminal like the Python script
 #[tauri::command]
 pub async fn start_simple_whive_mining(
     whive_address: String,
     threads: Option<u32>,
 ) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
-        .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
-
-    // Look for minerd in whive-core first (like Python script), then melanin_miners
-    let mut minerd_path = home_dir.join("whive-core/whive/miner/minerd");
-    if !minerd_path.exists() {
-        minerd_path = home_dir.join("melanin_miners/minerd");
-        if !minerd_path.exists() {
-            minerd_path = home_dir.join("melanin_miners/cpuminer-multi");
-        }
-    }
-
-    if !minerd_path.exists() {
-        return Err(AppError::Mining(
-            "Miner not found. Please install mining executables first.".to_string(),
-        ));
-    }
+    let minerd_path = find_simple_minerd()?;
 
     let num_threads = threads.unwrap_or(2);
     let user_string = format!("{}.w1", whive_address);
+    let threads_str = num_threads.to_string();
+
+    // Outside macOS there is no Terminal.app to open; exec the miner
+    // directly under the process manager, which also gives stop_mining and
+    // the status polls something to track.
+    if !cfg!(target_os = "macos") {
+        let args = [
+            "-a",
+            "yespower",
+            "-o",
+            "stratum+tcp://206.189.2.17:3333",
+            "-u",
+            &user_string,
+            "-t",
+            &threads_str,
+        ];
+        let pid = get_process_manager()
+            .start_process("whive_miner", &minerd_path, &args, None)
+            .await?;
+        return Ok(format!("Started Whive mining with PID: {pid}"));
+    }
 
     // Exact command from Python script
     let cmd = format!(
@@ -851,15 +883,16 @@ pub async fn start_simple_whive_mining(
         num_threads
     );
 
-    // Use osascript to open Terminal like Python script
-    let osascript_cmd = format!(
-        r#"osascript -e 'tell application "Terminal" to do script "{}"'"#,
-        cmd
+    // Invoke osascript directly with an argv; routing the whole line
+    // through `sh -c` forks an extra shell and re-parses the command.
+    let script = format!(
+        r#"tell application "Terminal" to do script {}"#,
+        applescript_string(&cmd)
     );
 
-    std::process::Command::new("sh")
-        .arg("-c")
-        .arg(&osascript_cmd)
+    tokio::process::Command::new("osascript")
+        .arg("-e")
+        .arg(&script)
         .spawn()
         .map_err(|e| AppError::Mining(format!("Failed to start Terminal: {e}")))?;
 
@@ -871,26 +904,29 @@ pub async fn start_simple_bitcoin_mining(
     bitcoin_address: String,
     worker_name: String,
 ) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
-        .ok_or_else(|| AppError::Mining("Could not find home directory".to_string()))?;
+    let minerd_path = find_simple_minerd()?;
 
-    // Look for minerd in whive-core first (like Python script), then melanin_miners
-    let mut minerd_path = home_dir.join("whive-core/whive/miner/minerd");
-    if !minerd_path.exists() {
-        minerd_path = home_dir.join("melanin_miners/minerd");
-        if !minerd_path.exists() {
-            minerd_path = home_dir.join("melanin_miners/cpuminer-multi");
-        }
-    }
+    let user_string = format!("{bitcoin_address}.{worker_name}");
 
-    if !minerd_path.exists() {
-        return Err(AppError::Mining(
-            "Miner not found. Please install mining executables first.".to_string(),
-        ));
+    // See start_simple_whive_mining: exec the miner directly where there is
+    // no Terminal.app.
+    if !cfg!(target_os = "macos") {
+        let args = [
+            "-a",
+            "sha256d",
+            "-o",
+            "stratum+tcp://public-pool.io:21496",
+            "-u",
+            &user_string,
+            "-p",
+            "x",
+        ];
+        let pid = get_process_manager()
+            .start_process("bitcoin_miner", &minerd_path, &args, None)
+            .await?;
+        return Ok(format!("Started Bitcoin mining with PID: {pid}"));
     }
 
-    let user_string = format!("{bitcoin_address}.{worker_name}");
-
     // Exact command from Python script
     let cmd = format!(
         "{} -a sha256d -o stratum+tcp://public-pool.io:21496 -u {} -p x",
@@ -898,15 +934,16 @@ pub async fn start_simple_bitcoin_mining(
         user_string
     );
 
-    // Use osascript to open Terminal like Python script
-    let osascript_cmd = format!(
-        r#"osascript -e 'tell application "Terminal" to do script "{}"'"#,
-        cmd
+    // Invoke osascript directly with an argv; routing the whole line
+    // through `sh -c` forks an extra shell and re-parses the command.
+    let script = format!(
+        r#"tell application "Terminal" to do script {}"#,
+        applescript_string(&cmd)
     );
 
-    std::process::Command::new("sh")
-        .arg("-c")
-        .arg(&osascript_cmd)
+    tokio::process::Command::new("osascript")
+        .arg("-e")
+        .arg(&script)
         .spawn()
         .map_err(|e| AppError::Mining(format!("Failed to start Terminal: {e}")))?;
 
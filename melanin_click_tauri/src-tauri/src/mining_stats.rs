@@ -91,10 +91,15 @@ impl MiningStatsCollector {
                 let mut lines = reader.lines();
 
                 while let Ok(Some(line)) = lines.next_line().await {
+                    // Most miner output is boilerplate; only take the stats
+                    // lock for lines the parsers can actually use.
+                    if !Self::line_is_relevant(&line) {
+                        continue;
+                    }
                     if let Err(e) =
                         Self::parse_mining_output(&stats_clone, &mining_type_clone, &line).await
                     {
-                        eprintln!("Error parsing mining output: {}", e);
+                        tracing::warn!("Error parsing mining output: {}", e);
                     }
                 }
             }
@@ -103,6 +108,14 @@ impl MiningStatsCollector {
         Ok(())
     }
 
+    // Matches every line parse_whive_output/parse_bitcoin_output reacts to
+    fn line_is_relevant(line: &str) -> bool {
+        line.contains("accepted:")
+            || line.contains("H/s")
+            || line.contains("failed")
+            || line.contains("error")
+    }
+
     async fn parse_mining_output(
         stats: &Arc<Mutex<HashMap<String, RealMiningStats>>>,
         mining_type: &str,
@@ -254,21 +267,39 @@ impl MiningStatsCollector {
     pub async fn calculate_earnings(&self, mining_type: &str) {
         let mut stats_map = self.stats.lock().await;
         if let Some(stats) = stats_map.get_mut(mining_type) {
-            // Rough earnings calculation (would need real pool data in production)
-            let daily_earnings = match mining_type {
-                "whive" => {
-                    // Estimate based on hashrate and current Whive difficulty/price
-                    let blocks_per_day = (stats.hashrate * 86400.0) / 1_000_000.0; // Very rough estimate
-                    blocks_per_day * 0.001 // Placeholder
-                }
-                "bitcoin" => {
-                    // Bitcoin CPU mining earnings are essentially zero
-                    (stats.hashrate * 86400.0) / 1_000_000_000_000.0 * 0.000001 // Extremely small
-                }
-                _ => 0.0,
-            };
-            stats.estimated_earnings = daily_earnings;
+            stats.estimated_earnings = estimate_daily_earnings(mining_type, stats.hashrate);
+        }
+    }
+
+    // Apply the derived fields (temperature, earnings) and return the result
+    // in one pass, so status polls take the stats lock once instead of
+    // fetch / update / update / fetch.
+    pub async fn refresh_derived_stats(
+        &self,
+        mining_type: &str,
+        temperature: f64,
+    ) -> Option<RealMiningStats> {
+        let mut stats_map = self.stats.lock().await;
+        let stats = stats_map.get_mut(mining_type)?;
+        stats.temperature = temperature;
+        stats.estimated_earnings = estimate_daily_earnings(mining_type, stats.hashrate);
+        Some(stats.clone())
+    }
+}
+
+// Rough earnings calculation (would need real pool data in production)
+fn estimate_daily_earnings(mining_type: &str, hashrate: f64) -> f64 {
+    match mining_type {
+        "whive" => {
+            // Estimate based on hashrate and current Whive difficulty/price
+            let blocks_per_day = (hashrate * 86400.0) / 1_000_000.0; // Very rough estimate
+            blocks_per_day * 0.001 // Placeholder
+        }
+        "bitcoin" => {
+            // Bitcoin CPU mining earnings are essentially zero
+            (hashrate * 86400.0) / 1_000_000_000_000.0 * 0.000001 // Extremely small
         }
+        _ => 0.0,
     }
 }
 
@@ -144,7 +144,7 @@ pub mod android {
             };
             
             if let Err(e) = mobile_manager.update_battery_info(battery_info).await {
-                eprintln!("Failed to update battery info: {}", e);
+                tracing::warn!("Failed to update battery info: {}", e);
             }
         }
     }
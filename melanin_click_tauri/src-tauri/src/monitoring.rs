@@ -2,7 +2,7 @@ use crate::core::get_process_manager;
 use crate::mining_stats::MINING_STATS;
 use crate::{AppError, AppState, GpuDevice, MiningStats, SystemInfo};
 use std::collections::HashMap;
-use sysinfo::System;
+use sysinfo::{CpuRefreshKind, MemoryRefreshKind, RefreshKind, System};
 use tauri::State;
 
 // Get Real-time Mining Statistics
@@ -11,19 +11,15 @@ pub async fn get_real_mining_stats(
     mining_type: String,
     _state: State<'_, AppState>,
 ) -> Result<MiningStats, AppError> {
-    // Get real stats from the mining stats collector
+    // Probe the temperature only while a miner is actually tracked, then
+    // refresh the derived fields and read the result in a single pass over
+    // the collector instead of fetch / update / update / fetch.
     if let Some(real_stats) = MINING_STATS.get_stats(&mining_type).await {
-        // Update temperature and earnings calculation
-        MINING_STATS
-            .update_temperature(&mining_type, get_cpu_temperature().await.unwrap_or(35.0))
-            .await;
-        MINING_STATS.calculate_earnings(&mining_type).await;
-
-        // Get updated stats
+        let temperature = get_cpu_temperature().await.unwrap_or(35.0);
         let updated_stats = MINING_STATS
-            .get_stats(&mining_type)
+            .refresh_derived_stats(&mining_type, temperature)
             .await
-            .unwrap_or(real_stats.clone());
+            .unwrap_or(real_stats);
 
         // Convert to the UI MiningStats format
         Ok(MiningStats {
@@ -64,8 +60,13 @@ pub async fn get_real_mining_stats(
 // Get Comprehensive System Information
 #[tauri::command]
 pub async fn get_system_info(state: State<'_, AppState>) -> Result<SystemInfo, AppError> {
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    // Only memory and CPU data are read below; a full refresh would also
+    // enumerate every process on the machine.
+    let sys = System::new_with_specifics(
+        RefreshKind::new()
+            .with_memory(MemoryRefreshKind::everything())
+            .with_cpu(CpuRefreshKind::everything()),
+    );
 
     // Get system information (simplified for sysinfo v0.30)
     let platform = std::env::consts::OS.to_string();
@@ -74,9 +75,7 @@ pub async fn get_system_info(state: State<'_, AppState>) -> Result<SystemInfo, A
     let total_memory = sys.total_memory();
     let available_memory = sys.available_memory();
 
-    // For now, set disk space to default values - can be enhanced later
-    let disk_space = 1_000_000_000_000_u64; // 1TB default
-    let available_disk_space = 500_000_000_000u64; // 500GB default
+    let (disk_space, available_disk_space) = get_disk_space();
 
     // CPU information
     let cpu_cores = sys.physical_core_count().unwrap_or(0);
@@ -115,8 +114,11 @@ pub async fn get_system_info(state: State<'_, AppState>) -> Result<SystemInfo, A
 // Get Hardware Information
 #[tauri::command]
 pub async fn get_hardware_info() -> Result<crate::HardwareInfo, AppError> {
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    let sys = System::new_with_specifics(
+        RefreshKind::new()
+            .with_memory(MemoryRefreshKind::everything())
+            .with_cpu(CpuRefreshKind::everything()),
+    );
 
     let cpu_cores = sys.physical_core_count().unwrap_or(0);
     let cpu_threads = sys.cpus().len();
@@ -168,17 +170,78 @@ pub async fn benchmark_hardware() -> Result<HashMap<String, f64>, AppError> {
 
 // Helper functions
 
+// Disk numbers move slowly; hold them for a short TTL so back-to-back
+// queries (status poll plus an install pre-check) share one disk refresh.
+const DISK_SPACE_TTL: std::time::Duration = std::time::Duration::from_secs(5);
+
+static DISK_SPACE_CACHE: std::sync::OnceLock<
+    std::sync::Mutex<Option<(std::time::Instant, (u64, u64))>>,
+> = std::sync::OnceLock::new();
+
+// Capacity of the volume holding the user's home directory, where installs
+// and chain data live. Falls back to the first listed disk when no mount
+// point matches (e.g. unusual container layouts).
+fn get_disk_space() -> (u64, u64) {
+    let cache = DISK_SPACE_CACHE.get_or_init(Default::default);
+    if let Ok(cached) = cache.lock() {
+        if let Some((fetched_at, space)) = *cached {
+            if fetched_at.elapsed() < DISK_SPACE_TTL {
+                return space;
+            }
+        }
+    }
+
+    let space = refresh_disk_space();
+    if let Ok(mut cached) = cache.lock() {
+        *cached = Some((std::time::Instant::now(), space));
+    }
+    space
+}
+
+fn refresh_disk_space() -> (u64, u64) {
+    let disks = sysinfo::Disks::new_with_refreshed_list();
+    let home = crate::core::home_dir().unwrap_or_else(|| std::path::Path::new("/"));
+
+    let mut best: Option<(&sysinfo::Disk, usize)> = None;
+    for disk in disks.list() {
+        let mount = disk.mount_point();
+        if home.starts_with(mount) {
+            let depth = mount.components().count();
+            if best.map_or(true, |(_, d)| depth > d) {
+                best = Some((disk, depth));
+            }
+        }
+    }
+
+    match best.map(|(d, _)| d).or_else(|| disks.list().first()) {
+        Some(disk) => (disk.total_space(), disk.available_space()),
+        None => (0, 0),
+    }
+}
+
 async fn get_cpu_temperature() -> Option<f64> {
     // Platform-specific temperature reading
     #[cfg(target_os = "linux")]
     {
-        // Try to read from thermal zones
-        for i in 0..10 {
-            let thermal_path = format!("/sys/class/thermal/thermal_zone{}/temp", i);
-            if let Ok(temp_str) = std::fs::read_to_string(&thermal_path) {
-                if let Ok(temp_millidegrees) = temp_str.trim().parse::<i32>() {
-                    return Some(temp_millidegrees as f64 / 1000.0);
-                }
+        // Probe the thermal zones once and remember which one answered;
+        // this runs on every stats poll and the zone layout never changes
+        // while we are running.
+        static THERMAL_ZONE: std::sync::OnceLock<Option<String>> = std::sync::OnceLock::new();
+
+        fn read_zone(path: &str) -> Option<f64> {
+            let temp_str = std::fs::read_to_string(path).ok()?;
+            let temp_millidegrees = temp_str.trim().parse::<i32>().ok()?;
+            Some(temp_millidegrees as f64 / 1000.0)
+        }
+
+        let zone = THERMAL_ZONE.get_or_init(|| {
+            (0..10)
+                .map(|i| format!("/sys/class/thermal/thermal_zone{}/temp", i))
+                .find(|path| read_zone(path).is_some())
+        });
+        if let Some(path) = zone {
+            if let Some(temp) = read_zone(path) {
+                return Some(temp);
             }
         }
     }
@@ -202,8 +265,8 @@ async fn get_cpu_temperature() -> Option<f64> {
     {
         // Windows temperature reading would require WMI
         // For now, return estimated temperature based on load
-        let mut sys = System::new_all();
-        sys.refresh_all();
+        let sys =
+            System::new_with_specifics(RefreshKind::new().with_cpu(CpuRefreshKind::everything()));
         let cpu_usage = sys.global_cpu_info().cpu_usage();
         return Some(35.0 + (cpu_usage as f64 * 0.4)); // Estimate
     }
@@ -244,8 +307,7 @@ async fn get_mining_uptime(process_name: &str) -> Option<u64> {
 #[allow(dead_code)]
 async fn estimate_hashrate(mining_type: &str, threads: u32) -> f64 {
     // Estimate hashrate based on CPU performance and algorithm
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    let sys = System::new_with_specifics(RefreshKind::new().with_cpu(CpuRefreshKind::everything()));
 
     let cpu_usage = sys.global_cpu_info().cpu_usage();
     let cpu_frequency = sys
@@ -269,7 +331,15 @@ async fn estimate_hashrate(mining_type: &str, threads: u32) -> f64 {
     }
 }
 
+// Detected once per run: both probes fork a vendor tool (nvidia-smi /
+// rocm-smi), and the installed GPUs do not change while the app is open.
+static GPU_DEVICES: std::sync::OnceLock<Vec<GpuDevice>> = std::sync::OnceLock::new();
+
 async fn detect_gpu_devices() -> Result<Vec<GpuDevice>, AppError> {
+    Ok(GPU_DEVICES.get_or_init(probe_gpu_devices).clone())
+}
+
+fn probe_gpu_devices() -> Vec<GpuDevice> {
     let mut devices = Vec::new();
 
     // NVIDIA GPU detection
@@ -318,13 +388,14 @@ async fn detect_gpu_devices() -> Result<Vec<GpuDevice>, AppError> {
         }
     }
 
-    Ok(devices)
+    devices
 }
 
 async fn benchmark_yespower_cpu(threads: usize) -> Result<f64, AppError> {
     // Estimate Yespower performance based on CPU specs
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    let sys = System::new_with_specifics(
+        RefreshKind::new().with_cpu(CpuRefreshKind::new().with_frequency()),
+    );
 
     let cpu_frequency = sys
         .cpus()
@@ -340,8 +411,9 @@ async fn benchmark_yespower_cpu(threads: usize) -> Result<f64, AppError> {
 
 async fn benchmark_sha256_cpu(threads: usize) -> Result<f64, AppError> {
     // Estimate SHA-256 performance
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    let sys = System::new_with_specifics(
+        RefreshKind::new().with_cpu(CpuRefreshKind::new().with_frequency()),
+    );
 
     let cpu_frequency = sys
         .cpus()
@@ -6,30 +6,24 @@ use tauri::State;
 
 #[tauri::command]
 pub async fn download_and_install_bitcoin(state: State<'_, AppState>) -> Result<String, AppError> {
-    let url = get_bitcoin_download_url().await?;
-    let home_dir = dirs::home_dir()
+    let _install_guard = crate::core::try_begin_install("bitcoin").ok_or_else(|| {
+        AppError::Node("Bitcoin Core installation is already in progress".to_string())
+    })?;
+    let url = get_bitcoin_download_url();
+    let install_path = crate::core::bitcoin_core_dir()
         .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
-    let install_path = home_dir.join("bitcoin-core");
     let filename = url.split('/').next_back().unwrap_or("bitcoin.tar.gz");
-    let downloaded_file = install_path.join(filename);
-
-    ensure_directory_exists(&install_path).await?;
 
-    // Download the file
-    download_file_internal(&url, &downloaded_file, &state).await?;
+    ensure_directory_exists(install_path).await?;
 
-    // Extract based on file type
-    if filename.ends_with(".tar.gz") {
-        extract_tarball(&downloaded_file, &install_path).await?;
-        fs::remove_file(&downloaded_file)?;
-    } else if filename.ends_with(".zip") {
-        extract_zip(&downloaded_file, &install_path).await?;
-        fs::remove_file(&downloaded_file)?;
-    }
+    install_archive(url, filename, install_path, &state).await?;
 
     // Set executable permissions on Unix-like systems
     crate::core::set_executable_permissions(&install_path).await?;
 
+    // A fresh install may have moved the binaries
+    invalidate_executable_cache(&install_path);
+
     // Create Bitcoin configuration directories
     create_bitcoin_config_dirs().await?;
 
@@ -41,30 +35,24 @@ pub async fn download_and_install_bitcoin(state: State<'_, AppState>) -> Result<
 
 #[tauri::command]
 pub async fn download_and_install_whive(state: State<'_, AppState>) -> Result<String, AppError> {
-    let url = get_whive_download_url().await?;
-    let home_dir = dirs::home_dir()
+    let _install_guard = crate::core::try_begin_install("whive").ok_or_else(|| {
+        AppError::Node("Whive Core installation is already in progress".to_string())
+    })?;
+    let url = get_whive_download_url();
+    let install_path = crate::core::whive_core_dir()
         .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
-    let install_path = home_dir.join("whive-core");
     let filename = url.split('/').next_back().unwrap_or("whive.tar.gz");
-    let downloaded_file = install_path.join(filename);
-
-    ensure_directory_exists(&install_path).await?;
 
-    // Download the file
-    download_file_internal(&url, &downloaded_file, &state).await?;
+    ensure_directory_exists(install_path).await?;
 
-    // Extract based on file type
-    if filename.ends_with(".tar.gz") {
-        extract_tarball(&downloaded_file, &install_path).await?;
-        fs::remove_file(&downloaded_file)?;
-    } else if filename.ends_with(".zip") {
-        extract_zip(&downloaded_file, &install_path).await?;
-        fs::remove_file(&downloaded_file)?;
-    }
+    install_archive(url, filename, install_path, &state).await?;
 
     // Set executable permissions
     crate::core::set_executable_permissions(&install_path).await?;
 
+    // A fresh install may have moved the binaries
+    invalidate_executable_cache(&install_path);
+
     Ok(
         "Whive Core installed successfully. Includes whived, whive-qt, and minerd for mining."
             .to_string(),
@@ -73,84 +61,64 @@ pub async fn download_and_install_whive(state: State<'_, AppState>) -> Result<St
 
 #[tauri::command]
 pub async fn run_bitcoin_mainnet(use_qt: Option<bool>) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
-        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
-
-    // Default to daemon mode (bitcoind) for better monitoring
-    let prefer_qt = use_qt.unwrap_or(false);
-    let bitcoin_path = find_bitcoin_executable(&home_dir, prefer_qt)?;
-
-    let mainnet_conf_dir = home_dir.join(".bitcoin");
-    let conf_path = mainnet_conf_dir.join("bitcoin.conf");
-
-    if !conf_path.exists() {
-        ensure_directory_exists(&mainnet_conf_dir).await?;
-        create_bitcoin_conf(&conf_path, false).await?;
-    }
-
-    let process_manager = get_process_manager();
-    let conf_arg = format!("-conf={}", conf_path.display());
-    let mut args = vec![conf_arg.as_str()];
-
-    // Add daemon flag if using bitcoind
-    if !prefer_qt {
-        args.push("-daemon");
-    }
-
-    let pid = process_manager
-        .start_process("bitcoin_mainnet", &bitcoin_path, &args, None)
-        .await?;
-
-    let executable_name = if prefer_qt { "bitcoin-qt" } else { "bitcoind" };
-    Ok(format!(
-        "Started Bitcoin mainnet node ({}) with PID: {}",
-        executable_name, pid
-    ))
+    launch_bitcoin_node(false, use_qt).await
 }
 
 #[tauri::command]
 pub async fn run_bitcoin_pruned(use_qt: Option<bool>) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
-        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
+    launch_bitcoin_node(true, use_qt).await
+}
 
+// Shared launch path for the mainnet and pruned commands; the two only
+// differ in the generated config, the -prune argument and the process name.
+async fn launch_bitcoin_node(prune: bool, use_qt: Option<bool>) -> Result<String, AppError> {
+    // Default to daemon mode (bitcoind) for better monitoring
     let prefer_qt = use_qt.unwrap_or(false);
-    let bitcoin_path = find_bitcoin_executable(&home_dir, prefer_qt)?;
+    let bitcoin_path = find_bitcoin_executable(prefer_qt)?;
 
-    let pruned_conf_dir = home_dir.join(".bitcoin");
-    let conf_path = pruned_conf_dir.join("bitcoin.conf");
+    let conf_dir = crate::core::bitcoin_data_dir()
+        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
+    let conf_path = conf_dir.join("bitcoin.conf");
 
     if !conf_path.exists() {
-        ensure_directory_exists(&pruned_conf_dir).await?;
-        create_bitcoin_conf(&conf_path, true).await?;
+        ensure_directory_exists(conf_dir).await?;
+        create_bitcoin_conf(&conf_path, prune).await?;
     }
 
     let process_manager = get_process_manager();
     let conf_arg = format!("-conf={}", conf_path.display());
-    let mut args = vec![conf_arg.as_str(), "-prune=550"];
+    let mut args = vec![conf_arg.as_str()];
+
+    if prune {
+        args.push("-prune=550");
+    }
 
     // Add daemon flag if using bitcoind
     if !prefer_qt {
         args.push("-daemon");
     }
 
+    let process_name = if prune {
+        "bitcoin_pruned"
+    } else {
+        "bitcoin_mainnet"
+    };
     let pid = process_manager
-        .start_process("bitcoin_pruned", &bitcoin_path, &args, None)
+        .start_process(process_name, &bitcoin_path, &args, None)
         .await?;
 
     let executable_name = if prefer_qt { "bitcoin-qt" } else { "bitcoind" };
+    let node_kind = if prune { "pruned" } else { "mainnet" };
     Ok(format!(
-        "Started Bitcoin pruned node ({}) with PID: {}",
-        executable_name, pid
+        "Started Bitcoin {} node ({}) with PID: {}",
+        node_kind, executable_name, pid
     ))
 }
 
 #[tauri::command]
 pub async fn run_whive_node(use_qt: Option<bool>) -> Result<String, AppError> {
-    let home_dir = dirs::home_dir()
-        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
-
     let prefer_qt = use_qt.unwrap_or(false);
-    let whive_path = find_whive_executable(&home_dir, prefer_qt)?;
+    let whive_path = find_whive_executable(prefer_qt)?;
 
     let process_manager = get_process_manager();
     let mut args = vec![];
@@ -190,94 +158,116 @@ pub async fn get_node_status(node_type: String) -> Result<NodeStatus, AppError>
         (0.0, 0, 0)
     };
 
+    // Decide the chain once instead of repeating the ternary per field
+    let chain = if node_type.contains("bitcoin") {
+        "bitcoin"
+    } else {
+        "whive"
+    };
+
     Ok(NodeStatus {
         is_running,
         sync_progress,
         block_height,
         peer_count,
         network: "mainnet".to_string(),
-        data_dir: format!(
-            "~/.{}",
-            if node_type.contains("bitcoin") {
-                "bitcoin"
-            } else {
-                "whive"
-            }
-        ),
-        config_path: format!(
-            "~/.{}/{}.conf",
-            if node_type.contains("bitcoin") {
-                "bitcoin"
-            } else {
-                "whive"
-            },
-            if node_type.contains("bitcoin") {
-                "bitcoin"
-            } else {
-                "whive"
-            }
-        ),
+        data_dir: format!("~/.{}", chain),
+        config_path: format!("~/.{}/{}.conf", chain, chain),
     })
 }
 
-// Helper functions
-async fn get_bitcoin_download_url() -> Result<String, AppError> {
-    let os_type = std::env::consts::OS;
-    let arch = std::env::consts::ARCH;
-    let version = "28.0"; // Using stable version
-
-    let url = match (os_type, arch) {
-        ("macos", "aarch64") => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-arm64-apple-darwin.tar.gz",
-            version, version
-        ),
-        ("macos", _) => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-apple-darwin.tar.gz",
-            version, version
-        ),
-        ("linux", "aarch64") => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-aarch64-linux-gnu.tar.gz",
-            version, version
-        ),
-        ("linux", _) => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-linux-gnu.tar.gz",
-            version, version
-        ),
-        ("windows", _) => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-win64.zip",
-            version, version
-        ),
-        _ => format!(
-            "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-apple-darwin.tar.gz",
-            version, version
-        ),
-    };
+// Pinned release versions; these determine both the download URLs and the
+// directory layout the archives unpack to.
+const BITCOIN_VERSION: &str = "28.0";
+const WHIVE_VERSION: &str = "22.2.2";
+
+// bitcoin.conf tuning for the build target, fixed at compile time.
+const DBCACHE_MB: u32 = if cfg!(target_os = "linux") {
+    450
+} else if cfg!(target_os = "macos") {
+    800
+} else if cfg!(target_os = "windows") {
+    600
+} else {
+    0
+};
+const SCRIPT_VERIFY_THREADS: u32 = if cfg!(target_arch = "aarch64") { 4 } else { 8 };
 
-    Ok(url)
+// Helper functions
+// Memoized: a pure function of the target platform and the pinned version,
+// so build the string once and hand out the same &str afterwards.
+fn get_bitcoin_download_url() -> &'static str {
+    static URL: std::sync::OnceLock<String> = std::sync::OnceLock::new();
+    URL.get_or_init(|| {
+        let os_type = std::env::consts::OS;
+        let arch = std::env::consts::ARCH;
+        let version = BITCOIN_VERSION;
+
+        match (os_type, arch) {
+            ("macos", "aarch64") => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-arm64-apple-darwin.tar.gz",
+                version, version
+            ),
+            ("macos", _) => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-apple-darwin.tar.gz",
+                version, version
+            ),
+            ("linux", "aarch64") => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-aarch64-linux-gnu.tar.gz",
+                version, version
+            ),
+            ("linux", _) => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-linux-gnu.tar.gz",
+                version, version
+            ),
+            ("windows", _) => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-win64.zip",
+                version, version
+            ),
+            _ => format!(
+                "https://bitcoincore.org/bin/bitcoin-core-{}/bitcoin-{}-x86_64-apple-darwin.tar.gz",
+                version, version
+            ),
+        }
+    })
 }
 
-async fn get_whive_download_url() -> Result<String, AppError> {
-    let os_type = std::env::consts::OS;
-    let arch = std::env::consts::ARCH;
-    let version = "22.2.2";
+fn get_whive_download_url() -> &'static str {
+    static URL: std::sync::OnceLock<String> = std::sync::OnceLock::new();
+    URL.get_or_init(|| {
+        let os_type = std::env::consts::OS;
+        let arch = std::env::consts::ARCH;
+        let version = WHIVE_VERSION;
 
-    let url = match (os_type, arch) {
+        match (os_type, arch) {
         ("macos", "aarch64") => format!("https://github.com/whiveio/whive/releases/download/{}/whive-ventura-{}-arm64.tar.gz", version, version),
         ("macos", _) => format!("https://github.com/whiveio/whive/releases/download/{}/whive-ventura-{}-osx64.tar.gz", version, version),
         ("linux", _) => format!("https://github.com/whiveio/whive/releases/download/{}/whive-{}-x86_64-linux-gnu.tar.gz", version, version),
         ("windows", _) => format!("https://github.com/whiveio/whive/releases/download/{}/whive-{}-win64.zip", version, version),
         _ => format!("https://github.com/whiveio/whive/releases/download/{}/whive-ventura-{}-osx64.tar.gz", version, version),
-    };
+        }
+    })
+}
 
-    Ok(url)
+// Fire-and-forget HEAD requests against both download hosts so DNS and the
+// TLS session are warm by the time the user clicks install. Failures are
+// irrelevant; the real GET reports its own errors.
+pub fn prime_download_connections() {
+    tauri::async_runtime::spawn(async {
+        let client = crate::core::http_client();
+        for url in [get_bitcoin_download_url(), get_whive_download_url()] {
+            let _ = client.head(url).send().await;
+        }
+    });
 }
 
 async fn download_file_internal(
     url: &str,
     destination: &Path,
     state: &State<'_, AppState>,
+    expected_sha256: Option<&str>,
 ) -> Result<(), AppError> {
-    let client = reqwest::Client::new();
+    let client = crate::core::http_client();
     let response = client
         .get(url)
         .send()
@@ -291,100 +281,91 @@ async fn download_file_internal(
         )));
     }
 
-    let total_size = response.content_length().unwrap_or(0);
+    let sink = crate::core::DownloadSink::file(destination, expected_sha256)?;
+    crate::core::stream_download(response, sink, &state.downloads, url, url).await
+}
 
-    let mut file = std::fs::File::create(destination)?;
-    let start_time = std::time::Instant::now();
+// Fetch an archive and unpack it into install_path. Gzipped tarballs are
+// streamed from the network straight into the extractor when possible so
+// download and extraction overlap; everything else (and systems without tar)
+// takes the download-then-extract path.
+async fn install_archive(
+    url: &str,
+    filename: &str,
+    install_path: &Path,
+    state: &State<'_, AppState>,
+) -> Result<(), AppError> {
+    if filename.ends_with(".tar.gz")
+        && download_and_extract_tarball(url, install_path, state).await?
+    {
+        // Streamed into tar directly; no archive left behind to delete
+        return Ok(());
+    }
 
-    // Use bytes() for reqwest 0.12
-    let bytes = response
-        .bytes()
-        .await
-        .map_err(|e| AppError::Node(format!("Download error: {}", e)))?;
+    let downloaded_file = install_path.join(filename);
+    download_file_internal(url, &downloaded_file, state, None).await?;
 
-    std::io::Write::write_all(&mut file, &bytes)?;
+    if filename.ends_with(".tar.gz") {
+        crate::core::extract_tarball_filtered(
+            &downloaded_file,
+            install_path,
+            Some(is_needed_node_archive_entry),
+        )
+        .await?;
+        fs::remove_file(&downloaded_file)?;
+    } else if filename.ends_with(".zip") {
+        crate::core::extract_zip(&downloaded_file, install_path).await?;
+        fs::remove_file(&downloaded_file)?;
+    }
 
-    let downloaded = bytes.len() as u64;
-    let elapsed = start_time.elapsed().as_secs_f64();
-    let speed = if elapsed > 0.0 {
-        downloaded as f64 / elapsed
-    } else {
-        0.0
-    };
+    Ok(())
+}
 
-    // Update progress
-    let progress = crate::DownloadProgress {
-        total_size,
-        downloaded,
-        speed,
-        status: "completed".to_string(),
-        url: url.to_string(),
-        started_at: chrono::Utc::now(),
-    };
+// Pipe the response body into `tar -xzf - -C dest` as chunks arrive, so the
+// network transfer and the gunzip + disk writes run concurrently and no
+// intermediate .tar.gz ever touches the disk. Returns Ok(false) when system
+// tar is unavailable and the caller should fall back.
+async fn download_and_extract_tarball(
+    url: &str,
+    extract_to: &Path,
+    state: &State<'_, AppState>,
+) -> Result<bool, AppError> {
+    if !(cfg!(unix) && which::which("tar").is_ok()) {
+        return Ok(false);
+    }
 
-    state
-        .downloads
-        .lock()
+    let client = crate::core::http_client();
+    let response = client
+        .get(url)
+        .send()
         .await
-        .insert(url.to_string(), progress);
+        .map_err(|e| AppError::Node(format!("Failed to download: {}", e)))?;
 
-    Ok(())
-}
+    if !response.status().is_success() {
+        return Err(AppError::Node(format!(
+            "Failed to download: HTTP {}",
+            response.status()
+        )));
+    }
 
-async fn extract_tarball(archive_path: &Path, extract_to: &Path) -> Result<(), AppError> {
-    let file = std::fs::File::open(archive_path)?;
-    let tar = flate2::read::GzDecoder::new(file);
-    let mut archive = tar::Archive::new(tar);
-    archive
-        .unpack(extract_to)
-        .map_err(|e| AppError::Node(format!("Failed to extract: {}", e)))?;
-    Ok(())
+    let sink = crate::core::DownloadSink::tar(extract_to)?;
+    crate::core::stream_download(response, sink, &state.downloads, url, url).await?;
+    Ok(true)
 }
 
-async fn extract_zip(archive_path: &Path, extract_to: &Path) -> Result<(), AppError> {
-    let file = std::fs::File::open(archive_path)?;
-    let mut archive = zip::ZipArchive::new(file)
-        .map_err(|e| AppError::Node(format!("Failed to open zip: {}", e)))?;
-
-    for i in 0..archive.len() {
-        let mut file = archive
-            .by_index(i)
-            .map_err(|e| AppError::Node(format!("Failed to read zip entry: {}", e)))?;
-        let outpath = match file.enclosed_name() {
-            Some(path) => extract_to.join(path),
-            None => continue,
-        };
-
-        if file.name().ends_with('/') {
-            std::fs::create_dir_all(&outpath)?;
-        } else {
-            if let Some(p) = outpath.parent() {
-                if !p.exists() {
-                    std::fs::create_dir_all(p)?;
-                }
-            }
-            let mut outfile = std::fs::File::create(&outpath)?;
-            std::io::copy(&mut file, &mut outfile)?;
-        }
-
-        // Set permissions on Unix
-        #[cfg(unix)]
-        {
-            use std::os::unix::fs::PermissionsExt;
-            if let Some(mode) = file.unix_mode() {
-                std::fs::set_permissions(&outpath, std::fs::Permissions::from_mode(mode))?;
-            }
-        }
-    }
-    Ok(())
+// In the node tarballs only bin/ (node and wallet binaries) and miner/
+// (whive bundles minerd there) are ever used after extraction.
+fn is_needed_node_archive_entry(entry_path: &Path) -> bool {
+    entry_path
+        .components()
+        .any(|c| c.as_os_str() == "bin" || c.as_os_str() == "miner")
 }
 
 async fn create_bitcoin_config_dirs() -> Result<(), AppError> {
-    let home_dir = dirs::home_dir()
+    let bitcoin_dir = crate::core::bitcoin_data_dir()
         .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
-    let bitcoin_dir = home_dir.join(".bitcoin");
 
-    ensure_directory_exists(&bitcoin_dir).await?;
+    ensure_directory_exists(bitcoin_dir).await?;
 
     // Create bitcoin.conf file
     let conf_path = bitcoin_dir.join("bitcoin.conf");
@@ -396,6 +377,31 @@ async fn create_bitcoin_config_dirs() -> Result<(), AppError> {
 }
 
 async fn create_bitcoin_conf(conf_path: &Path, prune: bool) -> Result<(), AppError> {
+    let content = bitcoin_conf_template(prune);
+
+    // Only touch the disk when the generated config actually differs from
+    // what is already there (e.g. repeat launches with the same settings).
+    if let Ok(existing) = std::fs::read_to_string(conf_path) {
+        if existing == content {
+            return Ok(());
+        }
+    }
+
+    std::fs::write(conf_path, content)?;
+    Ok(())
+}
+
+// The config body is a pure function of the build target and the RPC
+// password from the environment, none of which change mid-run, so each
+// variant is assembled once and reused by later launches.
+fn bitcoin_conf_template(prune: bool) -> &'static str {
+    static MAINNET_CONF: std::sync::OnceLock<String> = std::sync::OnceLock::new();
+    static PRUNED_CONF: std::sync::OnceLock<String> = std::sync::OnceLock::new();
+    let cell = if prune { &PRUNED_CONF } else { &MAINNET_CONF };
+    cell.get_or_init(|| build_bitcoin_conf(prune))
+}
+
+fn build_bitcoin_conf(prune: bool) -> String {
     let mut conf_content = vec![
         "# Bitcoin Core Configuration".to_string(),
         "# Generated by Melanin Click".to_string(),
@@ -428,90 +434,195 @@ async fn create_bitcoin_conf(conf_path: &Path, prune: bool) -> Result<(), AppErr
 
     conf_content.push("".to_string());
 
-    // OS-specific optimizations
-    match std::env::consts::OS {
-        "linux" => {
-            conf_content.push("# Linux Optimizations".to_string());
-            conf_content.push("dbcache=450".to_string());
-        }
-        "macos" => {
-            conf_content.push("# macOS Optimizations".to_string());
-            conf_content.push("dbcache=800".to_string());
-        }
-        "windows" => {
-            conf_content.push("# Windows Optimizations".to_string());
-            conf_content.push("dbcache=600".to_string());
-        }
-        _ => {}
+    // Platform-specific optimizations; the cfg! conditions collapse to
+    // literals at compile time, so these are resolved constants rather than
+    // per-call branch chains.
+    if DBCACHE_MB > 0 {
+        conf_content.push("# Platform Optimizations".to_string());
+        conf_content.push(format!("dbcache={}", DBCACHE_MB));
     }
+    conf_content.push(format!("par={}", SCRIPT_VERIFY_THREADS));
 
-    // Architecture-specific optimizations
-    match std::env::consts::ARCH {
-        "aarch64" => {
-            conf_content.push("par=4".to_string());
-        }
-        _ => {
-            conf_content.push("par=8".to_string());
-        }
-    }
+    conf_content.join("\n")
+}
 
-    std::fs::write(conf_path, conf_content.join("\n"))?;
-    Ok(())
+// Expected bin/ directories from the pinned release layouts
+// (bitcoin-<ver>/bin and whive/bin), joined once per run instead of being
+// rebuilt from version strings on every lookup.
+static BITCOIN_BIN_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+static WHIVE_BIN_DIR: std::sync::OnceLock<Option<PathBuf>> = std::sync::OnceLock::new();
+
+fn bitcoin_bin_dir() -> Option<&'static Path> {
+    BITCOIN_BIN_DIR
+        .get_or_init(|| {
+            crate::core::bitcoin_core_dir().map(|base| {
+                base.join(format!("bitcoin-{}", BITCOIN_VERSION))
+                    .join("bin")
+            })
+        })
+        .as_deref()
 }
 
-fn find_bitcoin_executable(home_dir: &Path, prefer_qt: bool) -> Result<PathBuf, AppError> {
-    let base_path = home_dir.join("bitcoin-core");
+fn whive_bin_dir() -> Option<&'static Path> {
+    WHIVE_BIN_DIR
+        .get_or_init(|| crate::core::whive_core_dir().map(|base| base.join("whive/bin")))
+        .as_deref()
+}
 
-    // Try to find the preferred executable first
-    if prefer_qt {
-        if let Ok(path) = find_executable_in_path_sync(&base_path, "bitcoin-qt") {
-            return Ok(path);
-        }
-        // Fallback to bitcoind
-        find_executable_in_path_sync(&base_path, "bitcoind")
+fn find_bitcoin_executable(prefer_qt: bool) -> Result<PathBuf, AppError> {
+    let base_path = crate::core::bitcoin_core_dir()
+        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
+    let (preferred, fallback) = if prefer_qt {
+        ("bitcoin-qt", "bitcoind")
     } else {
-        if let Ok(path) = find_executable_in_path_sync(&base_path, "bitcoind") {
-            return Ok(path);
+        ("bitcoind", "bitcoin-qt")
+    };
+    find_node_executable(base_path, bitcoin_bin_dir(), preferred, fallback)
+}
+
+fn find_whive_executable(prefer_qt: bool) -> Result<PathBuf, AppError> {
+    let base_path = crate::core::whive_core_dir()
+        .ok_or_else(|| AppError::Node("Could not find home directory".to_string()))?;
+    let (preferred, fallback) = if prefer_qt {
+        ("whive-qt", "whived")
+    } else {
+        ("whived", "whive-qt")
+    };
+    find_node_executable(base_path, whive_bin_dir(), preferred, fallback)
+}
+
+// The release archives unpack to a fixed layout, so probe the expected bin/
+// directory first and only fall back to a recursive search when the layout
+// does not match (e.g. a manually installed different version).
+fn probe_known_executable(bin_dir: &Path, executable_name: &str) -> Option<PathBuf> {
+    for name in [
+        executable_name.to_string(),
+        format!("{}.exe", executable_name),
+    ] {
+        let candidate = bin_dir.join(name);
+        if candidate.exists() {
+            return Some(candidate);
         }
-        // Fallback to bitcoin-qt
-        find_executable_in_path_sync(&base_path, "bitcoin-qt")
     }
+    None
 }
 
-fn find_whive_executable(home_dir: &Path, prefer_qt: bool) -> Result<PathBuf, AppError> {
-    let base_path = home_dir.join("whive-core");
+// Resolved executable paths, keyed by install root and preferred name. Every
+// hit is re-validated with exists() so a deleted install falls back to a
+// fresh search, and installs invalidate their root explicitly.
+static EXECUTABLE_CACHE: std::sync::OnceLock<
+    std::sync::Mutex<std::collections::HashMap<(PathBuf, String), PathBuf>>,
+> = std::sync::OnceLock::new();
+
+fn invalidate_executable_cache(base_path: &Path) {
+    if let Some(cache) = EXECUTABLE_CACHE.get() {
+        if let Ok(mut cache) = cache.lock() {
+            cache.retain(|(root, _), _| root != base_path);
+        }
+    }
+}
 
-    // Try to find the preferred executable first
-    if prefer_qt {
-        if let Ok(path) = find_executable_in_path_sync(&base_path, "whive-qt") {
-            return Ok(path);
+fn find_node_executable(
+    base_path: &Path,
+    known_bin_dir: Option<&Path>,
+    preferred: &str,
+    fallback: &str,
+) -> Result<PathBuf, AppError> {
+    let cache = EXECUTABLE_CACHE.get_or_init(Default::default);
+    let cache_key = (base_path.to_path_buf(), preferred.to_string());
+    if let Ok(cache) = cache.lock() {
+        if let Some(path) = cache.get(&cache_key) {
+            if path.exists() {
+                return Ok(path.clone());
+            }
         }
-        // Fallback to whived
-        find_executable_in_path_sync(&base_path, "whived")
-    } else {
-        if let Ok(path) = find_executable_in_path_sync(&base_path, "whived") {
-            return Ok(path);
+    }
+
+    let resolved = resolve_node_executable(base_path, known_bin_dir, preferred, fallback)?;
+    if let Ok(mut cache) = cache.lock() {
+        cache.insert(cache_key, resolved.clone());
+    }
+    Ok(resolved)
+}
+
+fn resolve_node_executable(
+    base_path: &Path,
+    known_bin_dir: Option<&Path>,
+    preferred: &str,
+    fallback: &str,
+) -> Result<PathBuf, AppError> {
+    if let Some(bin_dir) = known_bin_dir {
+        for name in [preferred, fallback] {
+            if let Some(path) = probe_known_executable(bin_dir, name) {
+                return Ok(path);
+            }
         }
-        // Fallback to whive-qt
-        find_executable_in_path_sync(&base_path, "whive-qt")
     }
+
+    // A bin/ directory noted during in-process extraction beats scanning
+    // the whole install tree.
+    if let Some(bin_dir) = crate::core::cached_bin_dir(base_path) {
+        for name in [preferred, fallback] {
+            for candidate in [bin_dir.join(name), bin_dir.join(format!("{}.exe", name))] {
+                if candidate.exists() {
+                    return Ok(candidate);
+                }
+            }
+        }
+    }
+
+    // Different version than expected: check <base>/<anything>/bin/ before
+    // resorting to a recursive walk, since release archives always unpack
+    // to a single versioned directory with a bin/ inside.
+    if let Ok(entries) = std::fs::read_dir(base_path) {
+        for entry in entries.flatten() {
+            if !entry.file_type().map(|ft| ft.is_dir()).unwrap_or(false) {
+                continue;
+            }
+            let bin_dir = entry.path().join("bin");
+            for name in [preferred, fallback] {
+                for candidate in [bin_dir.join(name), bin_dir.join(format!("{}.exe", name))] {
+                    if candidate.exists() {
+                        return Ok(candidate);
+                    }
+                }
+            }
+        }
+    }
+
+    if let Ok(path) = find_executable_in_path_sync(base_path, preferred) {
+        return Ok(path);
+    }
+    find_executable_in_path_sync(base_path, fallback)
 }
 
+// Release archives nest binaries at most a few levels deep; a depth bound
+// keeps the last-resort walk from descending into unrelated trees.
+const MAX_SEARCH_DEPTH: u32 = 4;
+
 fn find_executable_in_path_sync(
     base_path: &Path,
     executable_name: &str,
 ) -> Result<PathBuf, AppError> {
-    fn search_recursive(dir: &Path, target: &str) -> Option<PathBuf> {
+    fn search_recursive(dir: &Path, target: &str, depth: u32) -> Option<PathBuf> {
         if let Ok(entries) = std::fs::read_dir(dir) {
             for entry in entries.flatten() {
-                let path = entry.path();
-                if path.is_dir() {
-                    if let Some(found) = search_recursive(&path, target) {
+                // file_type() comes from the directory entry itself, so the
+                // walk costs one readdir per directory instead of an extra
+                // stat per entry.
+                let Ok(file_type) = entry.file_type() else {
+                    continue;
+                };
+                if file_type.is_dir() {
+                    if depth == 0 {
+                        continue;
+                    }
+                    if let Some(found) = search_recursive(&entry.path(), target, depth - 1) {
                         return Some(found);
                     }
-                } else if path
+                } else if entry
                     .file_name()
-                    .and_then(|name| name.to_str())
+                    .to_str()
                     .map(|name| {
                         name == target
                             || name == format!("{}.exe", target)
@@ -519,14 +630,14 @@ fn find_executable_in_path_sync(
                     })
                     .unwrap_or(false)
                 {
-                    return Some(path);
+                    return Some(entry.path());
                 }
             }
         }
         None
     }
 
-    search_recursive(base_path, executable_name).ok_or_else(|| {
+    search_recursive(base_path, executable_name, MAX_SEARCH_DEPTH).ok_or_else(|| {
         AppError::Node(format!(
             "{} executable not found in {}",
             executable_name,
@@ -535,14 +646,106 @@ fn find_executable_in_path_sync(
     })
 }
 
+// The UI polls node status continuously; hold RPC results for a short TTL
+// so rapid polls reuse one answer instead of each querying the node.
+const RPC_STATUS_TTL: std::time::Duration = std::time::Duration::from_secs(2);
+
+type RpcStatusCache = std::collections::HashMap<String, (std::time::Instant, (f64, u64, u32))>;
+
+static RPC_STATUS_CACHE: std::sync::OnceLock<tokio::sync::Mutex<RpcStatusCache>> =
+    std::sync::OnceLock::new();
+
 async fn get_node_rpc_status(node_type: &str) -> Result<(f64, u64, u32), AppError> {
-    // This would implement RPC calls to get actual node status
-    // For now, return mock data but this should be implemented
-    if node_type.contains("bitcoin") {
-        // TODO: Implement Bitcoin RPC calls
-        Ok((95.5, 850000, 8))
+    let cache = RPC_STATUS_CACHE.get_or_init(Default::default);
+    {
+        let cache = cache.lock().await;
+        if let Some((fetched_at, status)) = cache.get(node_type) {
+            if fetched_at.elapsed() < RPC_STATUS_TTL {
+                return Ok(*status);
+            }
+        }
+    }
+
+    let status = fetch_node_rpc_status(node_type).await?;
+    cache
+        .lock()
+        .await
+        .insert(node_type.to_string(), (std::time::Instant::now(), status));
+    Ok(status)
+}
+
+async fn fetch_node_rpc_status(node_type: &str) -> Result<(f64, u64, u32), AppError> {
+    let config = crate::config::get_config();
+    let (user, password, host, port) = if node_type.contains("bitcoin") {
+        (
+            &config.bitcoin_rpc_user,
+            &config.bitcoin_rpc_password,
+            &config.bitcoin_rpc_host,
+            config.bitcoin_rpc_port,
+        )
     } else {
-        // TODO: Implement Whive RPC calls
-        Ok((88.2, 425000, 6))
+        (
+            &config.whive_rpc_user,
+            &config.whive_rpc_password,
+            &config.whive_rpc_host,
+            config.whive_rpc_port,
+        )
+    };
+    let url = format!("http://{}:{}/", host, port);
+
+    let blockchain_info = node_rpc_call(&url, user, password, "getblockchaininfo").await?;
+    let connection_count = node_rpc_call(&url, user, password, "getconnectioncount").await?;
+
+    let sync_progress = blockchain_info
+        .get("verificationprogress")
+        .and_then(|v| v.as_f64())
+        .map(|p| p * 100.0)
+        .unwrap_or(0.0);
+    let block_height = blockchain_info
+        .get("blocks")
+        .and_then(|v| v.as_u64())
+        .unwrap_or(0);
+    let peer_count = connection_count.as_u64().unwrap_or(0) as u32;
+
+    Ok((sync_progress, block_height, peer_count))
+}
+
+// One JSON-RPC call against a local node. A hung daemon must not wedge the
+// status poll, so the request carries its own short timeout; the caller
+// falls back to zeroed values on any error.
+async fn node_rpc_call(
+    url: &str,
+    user: &str,
+    password: &str,
+    method: &str,
+) -> Result<serde_json::Value, AppError> {
+    let response = crate::core::http_client()
+        .post(url)
+        .basic_auth(user, Some(password))
+        .timeout(std::time::Duration::from_secs(5))
+        .json(&serde_json::json!({
+            "jsonrpc": "1.0",
+            "id": "melanin_click",
+            "method": method,
+            "params": [],
+        }))
+        .send()
+        .await
+        .map_err(|e| AppError::Node(format!("RPC request failed: {}", e)))?;
+
+    let body: serde_json::Value = response
+        .json()
+        .await
+        .map_err(|e| AppError::Node(format!("Invalid RPC response: {}", e)))?;
+
+    if let Some(error) = body.get("error").filter(|e| !e.is_null()) {
+        return Err(AppError::Node(format!(
+            "RPC error from {}: {}",
+            method, error
+        )));
     }
+
+    body.get("result")
+        .cloned()
+        .ok_or_else(|| AppError::Node(format!("RPC response from {} had no result", method)))
 }
@@ -11,6 +11,16 @@ pub async fn get_download_progress(
     Ok(downloads.get(&url).cloned())
 }
 
+// Snapshot of every tracked download, for pollers that do not know the
+// download URL key in advance.
+#[tauri::command]
+pub async fn get_active_downloads(
+    state: State<'_, AppState>,
+) -> Result<Vec<DownloadProgress>, AppError> {
+    let downloads = state.downloads.lock().await;
+    Ok(downloads.values().cloned().collect())
+}
+
 #[tauri::command]
 pub async fn check_file_exists(path: String) -> Result<bool, AppError> {
     Ok(Path::new(&path).exists())
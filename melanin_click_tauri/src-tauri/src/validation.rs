@@ -4,52 +4,83 @@ use sha2::{Digest, Sha256};
 // Bitcoin Address Validation
 #[tauri::command]
 pub async fn validate_bitcoin_address(address: String) -> Result<bool, AppError> {
-    if address.is_empty() {
-        return Ok(false);
-    }
-
-    // P2PKH addresses (start with 1)
-    if address.starts_with('1') && address.len() >= 26 && address.len() <= 35 {
-        return validate_legacy_address(&address, 0x00);
-    }
-
-    // P2SH addresses (start with 3)
-    if address.starts_with('3') && address.len() >= 26 && address.len() <= 35 {
-        return validate_legacy_address(&address, 0x05);
-    }
+    Ok(is_valid_bitcoin_address(&address))
+}
 
-    // Bech32 addresses (start with bc1)
-    if address.starts_with("bc1") {
-        return validate_bech32_address(&address);
-    }
+// Synchronous core of the Bitcoin validator. Validation never fails, it only
+// answers yes or no, so in-crate callers use this directly without paying for
+// the command wrapper, the owned String, or the Result.
+pub fn is_valid_bitcoin_address(address: &str) -> bool {
+    memoized(&LAST_BITCOIN_RESULT, address, check_bitcoin_address)
+}
 
-    // Testnet addresses
-    if address.starts_with('m') || address.starts_with('n') {
-        return validate_legacy_address(&address, 0x6f);
+// The UI tends to validate the same address several times in a row (field
+// change, focus-out, then the start click), so remember the last verdict
+// and skip the checksum hashing on repeats.
+static LAST_BITCOIN_RESULT: std::sync::OnceLock<std::sync::Mutex<Option<(String, bool)>>> =
+    std::sync::OnceLock::new();
+static LAST_WHIVE_RESULT: std::sync::OnceLock<std::sync::Mutex<Option<(String, bool)>>> =
+    std::sync::OnceLock::new();
+
+fn memoized(
+    cell: &'static std::sync::OnceLock<std::sync::Mutex<Option<(String, bool)>>>,
+    address: &str,
+    check: fn(&str) -> bool,
+) -> bool {
+    let cache = cell.get_or_init(Default::default);
+    if let Ok(cached) = cache.lock() {
+        if let Some((last, valid)) = cached.as_ref() {
+            if last == address {
+                return *valid;
+            }
+        }
     }
-
-    if address.starts_with('2') {
-        return validate_legacy_address(&address, 0xc4);
+    let valid = check(address);
+    if let Ok(mut cached) = cache.lock() {
+        *cached = Some((address.to_string(), valid));
     }
+    valid
+}
 
-    // Testnet bech32
-    if address.starts_with("tb1") {
-        return validate_testnet_bech32_address(&address);
+fn check_bitcoin_address(address: &str) -> bool {
+    if address.is_empty() {
+        return false;
+    }
+
+    // Length bounds shared by every supported format: the shortest bech32
+    // is 14 characters, the longest allowed by BIP-173 is 90.
+    if address.len() < 14 || address.len() > 90 {
+        return false;
+    }
+
+    // The address families are disjoint by first byte, so dispatch once on
+    // it instead of walking a chain of starts_with probes; anything else is
+    // rejected without touching a decoder.
+    match address.as_bytes()[0] {
+        // P2PKH / P2SH mainnet
+        b'1' if (26..=35).contains(&address.len()) => validate_legacy_address(address, 0x00),
+        b'3' if (26..=35).contains(&address.len()) => validate_legacy_address(address, 0x05),
+        // Mainnet bech32
+        b'b' if address.starts_with("bc1") => validate_bech32_address(address),
+        // Testnet legacy
+        b'm' | b'n' => validate_legacy_address(address, 0x6f),
+        b'2' => validate_legacy_address(address, 0xc4),
+        // Testnet bech32
+        b't' if address.starts_with("tb1") => validate_testnet_bech32_address(address),
+        _ => false,
     }
-
-    Ok(false)
 }
 
-fn validate_legacy_address(address: &str, version_byte: u8) -> Result<bool, AppError> {
+fn validate_legacy_address(address: &str, version_byte: u8) -> bool {
     match bs58::decode(address).into_vec() {
         Ok(decoded) => {
             if decoded.len() != 25 {
-                return Ok(false);
+                return false;
             }
 
             // Check version byte
             if decoded[0] != version_byte {
-                return Ok(false);
+                return false;
             }
 
             // Verify checksum
@@ -57,21 +88,21 @@ fn validate_legacy_address(address: &str, version_byte: u8) -> Result<bool, AppE
             let hash1 = Sha256::digest(payload);
             let hash2 = Sha256::digest(hash1);
 
-            Ok(&hash2[0..4] == checksum)
+            &hash2[0..4] == checksum
         }
-        Err(_) => Ok(false),
+        Err(_) => false,
     }
 }
 
-fn validate_bech32_address(address: &str) -> Result<bool, AppError> {
+fn validate_bech32_address(address: &str) -> bool {
     match bech32::decode(address) {
         Ok((hrp, data)) => {
             if hrp.as_str() != "bc" {
-                return Ok(false);
+                return false;
             }
 
             if data.is_empty() {
-                return Ok(false);
+                return false;
             }
 
             let witness_version = data[0];
@@ -79,49 +110,58 @@ fn validate_bech32_address(address: &str) -> Result<bool, AppError> {
 
             // Validate witness version and program length
             match witness_version {
-                0 => Ok(program.len() == 20 || program.len() == 32),
-                1..=16 => Ok(program.len() >= 2 && program.len() <= 40),
-                _ => Ok(false),
+                0 => program.len() == 20 || program.len() == 32,
+                1..=16 => program.len() >= 2 && program.len() <= 40,
+                _ => false,
             }
         }
-        Err(_) => Ok(false),
+        Err(_) => false,
     }
 }
 
-fn validate_testnet_bech32_address(address: &str) -> Result<bool, AppError> {
+fn validate_testnet_bech32_address(address: &str) -> bool {
     match bech32::decode(address) {
         Ok((hrp, data)) => {
             if hrp.as_str() != "tb" {
-                return Ok(false);
+                return false;
             }
 
             if data.is_empty() {
-                return Ok(false);
+                return false;
             }
 
             let witness_version = data[0];
             let program = &data[1..];
 
             match witness_version {
-                0 => Ok(program.len() == 20 || program.len() == 32),
-                1..=16 => Ok(program.len() >= 2 && program.len() <= 40),
-                _ => Ok(false),
+                0 => program.len() == 20 || program.len() == 32,
+                1..=16 => program.len() >= 2 && program.len() <= 40,
+                _ => false,
             }
         }
-        Err(_) => Ok(false),
+        Err(_) => false,
     }
 }
 
 // Whive Address Validation
 #[tauri::command]
 pub async fn validate_whive_address(address: String) -> Result<bool, AppError> {
+    Ok(is_valid_whive_address(&address))
+}
+
+// Synchronous core of the Whive validator; see is_valid_bitcoin_address.
+pub fn is_valid_whive_address(address: &str) -> bool {
+    memoized(&LAST_WHIVE_RESULT, address, check_whive_address)
+}
+
+fn check_whive_address(address: &str) -> bool {
     if address.is_empty() {
-        return Ok(false);
+        return false;
     }
 
     // Reject Bitcoin addresses first (they start with 1, 3, or bc1)
     if address.starts_with('1') || address.starts_with('3') || address.starts_with("bc1") {
-        return Ok(false);
+        return false;
     }
 
     // Whive uses similar address formats to Bitcoin but with different prefixes
@@ -129,30 +169,30 @@ pub async fn validate_whive_address(address: String) -> Result<bool, AppError> {
 
     // Standard Whive addresses (typically start with W)
     if address.starts_with('W') && address.len() >= 26 && address.len() <= 35 {
-        return validate_whive_legacy_address(&address);
+        return validate_whive_legacy_address(address);
     }
 
     // Whive script addresses (typically start with 7)
     if address.starts_with('7') && address.len() >= 26 && address.len() <= 35 {
-        return validate_whive_script_address(&address);
+        return validate_whive_script_address(address);
     }
 
     // Only accept addresses that start with valid Whive prefixes
     // Reject anything that doesn't start with W or 7 for now
-    Ok(false)
+    false
 }
 
-fn validate_whive_legacy_address(address: &str) -> Result<bool, AppError> {
+fn validate_whive_legacy_address(address: &str) -> bool {
     match bs58::decode(address).into_vec() {
         Ok(decoded) => {
             if decoded.len() != 25 {
-                return Ok(false);
+                return false;
             }
 
             // Whive version byte (adjust based on actual Whive specs)
             let expected_version = 0x49; // 'W' in Whive
             if decoded[0] != expected_version {
-                return Ok(false);
+                return false;
             }
 
             // Verify checksum using double SHA-256
@@ -160,23 +200,23 @@ fn validate_whive_legacy_address(address: &str) -> Result<bool, AppError> {
             let hash1 = Sha256::digest(payload);
             let hash2 = Sha256::digest(hash1);
 
-            Ok(&hash2[0..4] == checksum)
+            &hash2[0..4] == checksum
         }
-        Err(_) => Ok(false),
+        Err(_) => false,
     }
 }
 
-fn validate_whive_script_address(address: &str) -> Result<bool, AppError> {
+fn validate_whive_script_address(address: &str) -> bool {
     match bs58::decode(address).into_vec() {
         Ok(decoded) => {
             if decoded.len() != 25 {
-                return Ok(false);
+                return false;
             }
 
             // Whive script version byte
             let expected_version = 0x07; // Script addresses
             if decoded[0] != expected_version {
-                return Ok(false);
+                return false;
             }
 
             // Verify checksum
@@ -184,9 +224,9 @@ fn validate_whive_script_address(address: &str) -> Result<bool, AppError> {
             let hash1 = Sha256::digest(payload);
             let hash2 = Sha256::digest(hash1);
 
-            Ok(&hash2[0..4] == checksum)
+            &hash2[0..4] == checksum
         }
-        Err(_) => Ok(false),
+        Err(_) => false,
     }
 }
 
@@ -223,27 +263,31 @@ pub async fn verify_file_hash(
     Ok(computed_hash.to_lowercase() == expected_hash.to_lowercase())
 }
 
+// Characters that would allow shell or config injection in a pool URL.
+// Hoisted to a constant so the validator does not rebuild the array per call
+// (this runs on every config save and miner launch).
+const MALICIOUS_URL_CHARS: [char; 13] = [
+    '\'', '"', ';', '&', '|', '`', '$', '(', ')', '<', '>', '{', '}',
+];
+
 // URL Validation
 pub fn validate_pool_url(url: &str) -> Result<bool, AppError> {
     if url.is_empty() {
         return Ok(false);
     }
 
-    // Check for malicious characters first
-    let malicious_chars = [
-        '\'', '"', ';', '&', '|', '`', '$', '(', ')', '<', '>', '{', '}',
-    ];
-    if url.chars().any(|c| malicious_chars.contains(&c)) {
+    // Cheapest checks first: reject non-stratum schemes before scanning the
+    // string for malicious characters or attempting a full URL parse.
+    if !url.starts_with("stratum+tcp://") && !url.starts_with("stratum+ssl://") {
         return Ok(false);
     }
 
-    // Check for path traversal attempts
-    if url.contains("..") {
+    if url.chars().any(|c| MALICIOUS_URL_CHARS.contains(&c)) {
         return Ok(false);
     }
 
-    // Check for stratum protocol
-    if !url.starts_with("stratum+tcp://") && !url.starts_with("stratum+ssl://") {
+    // Check for path traversal attempts
+    if url.contains("..") {
         return Ok(false);
     }
 
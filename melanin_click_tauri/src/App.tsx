@@ -1,10 +1,6 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import Header from './components/Layout/Header';
 import HomePage from './pages/HomePage';
-import BitcoinPage from './pages/BitcoinPage';
-import WhivePage from './pages/WhivePage';
-import MiningPage from './pages/MiningPage';
-import SettingsPage from './pages/SettingsPage';
 import NotificationCenter from './components/Common/NotificationCenter';
 import ProcessStatusBar from './components/Common/ProcessStatusBar';
 import WelcomePage from './components/Onboarding/WelcomePage';
@@ -15,6 +11,13 @@ import { useSystemInfo } from './hooks/useSystemInfo';
 import { PageType, OnboardingStep, UserPreferences, InstallationPreference, ProcessStatus } from './types';
 import "./App.css";
 
+// Secondary pages are code-split so their bundles load on first visit
+// instead of slowing the initial render of the home screen.
+const BitcoinPage = React.lazy(() => import('./pages/BitcoinPage'));
+const WhivePage = React.lazy(() => import('./pages/WhivePage'));
+const MiningPage = React.lazy(() => import('./pages/MiningPage'));
+const SettingsPage = React.lazy(() => import('./pages/SettingsPage'));
+
 const App: React.FC = () => {
   const [currentPage, setCurrentPage] = useState<PageType>('home');
   const [onboardingStep, setOnboardingStep] = useState<OnboardingStep>('welcome');
@@ -125,8 +128,9 @@ const App: React.FC = () => {
     setOnboardingStep('terms');
   };
 
-  // Get available pages based on user preferences
-  const getAvailablePages = (): PageType[] => {
+  // Get available pages based on user preferences; memoized so page switches
+  // don't rebuild the list for both the header and the page router
+  const availablePages = useMemo<PageType[]>(() => {
     if (!userPreferences.hasCompletedOnboarding) {
       return ['home'];
     }
@@ -144,7 +148,7 @@ const App: React.FC = () => {
       default:
         return basePages;
     }
-  };
+  }, [userPreferences]);
 
   // Initialize application
   useEffect(() => {
@@ -197,37 +201,13 @@ const App: React.FC = () => {
     }
   }
 
+  // Resolve the page once; anything not currently available falls back to
+  // home without a render-phase state write.
+  const activePage = availablePages.includes(currentPage) ? currentPage : 'home';
+
   // Render current page
   const renderCurrentPage = () => {
-    const availablePages = getAvailablePages();
-    
-    // If current page is not available, switch to home
-    if (!availablePages.includes(currentPage)) {
-      setCurrentPage('home');
-      return (
-        <HomePage
-          systemInfo={systemInfo}
-          cryptoConfig={cryptoConfig}
-          processStatuses={processStatuses}
-          processes={processes}
-          onAddNotification={addNotification}
-          onUpdateProcessStatus={updateProcessStatus}
-        />
-      );
-    }
-
-    switch (currentPage) {
-      case 'home':
-        return (
-          <HomePage
-            systemInfo={systemInfo}
-            cryptoConfig={cryptoConfig}
-            processStatuses={processStatuses}
-            processes={processes}
-            onAddNotification={addNotification}
-            onUpdateProcessStatus={updateProcessStatus}
-          />
-        );
+    switch (activePage) {
       case 'bitcoin':
         return <BitcoinPage />;
       case 'whive':
@@ -253,9 +233,9 @@ const App: React.FC = () => {
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-900 via-slate-800 to-slate-900 flex flex-col">
       <Header 
-        currentPage={currentPage} 
+        currentPage={activePage} 
         onPageChange={setCurrentPage}
-        availablePages={getAvailablePages()}
+        availablePages={availablePages}
         userPreferences={userPreferences}
       />
       
@@ -263,7 +243,9 @@ const App: React.FC = () => {
         {/* Main content wrapper with consistent padding and max-width */}
         <div className="flex-1 max-w-7xl mx-auto w-full px-4 sm:px-6 lg:px-8 py-6">
           <div className="h-full">
-            {renderCurrentPage()}
+            <React.Suspense fallback={null}>
+              {renderCurrentPage()}
+            </React.Suspense>
           </div>
         </div>
       </main>
@@ -10,6 +10,17 @@ interface ProcessStatusBarProps {
   processStatuses: Record<string, ProcessStatus>;
 }
 
+// One lookup table instead of three ternary chains re-evaluated per process
+// per render; 'idle' is filtered out before rendering but kept here so every
+// status maps somewhere.
+const STATUS_STYLES: Record<ProcessStatus['status'], { dot: string; text: string; label: string }> = {
+  running: { dot: 'bg-green-500 animate-pulse', text: 'text-green-400', label: 'Running' },
+  starting: { dot: 'bg-yellow-500 animate-pulse', text: 'text-yellow-400', label: 'Starting...' },
+  stopping: { dot: 'bg-orange-500 animate-pulse', text: 'text-orange-400', label: 'Stopping...' },
+  error: { dot: 'bg-red-500', text: 'text-red-400', label: 'Error' },
+  idle: { dot: 'bg-gray-500', text: 'text-gray-500', label: 'Idle' },
+};
+
 const ProcessStatusBar: React.FC<ProcessStatusBarProps> = ({ processStatuses }) => {
   // Filter out processes that are idle to reduce clutter
   const activeProcesses = Object.entries(processStatuses).filter(([, status]) => 
@@ -37,33 +48,20 @@ const ProcessStatusBar: React.FC<ProcessStatusBarProps> = ({ processStatuses })
       <div className="container mx-auto px-6 py-3">
         <div className="flex items-center justify-between">
           <div className="flex items-center space-x-6 text-sm">
-            {activeProcesses.map(([key, status]) => (
-              <div key={key} className="flex items-center space-x-3">
-                <div className={`w-3 h-3 rounded-full ${
-                  status.status === 'running' ? 'bg-green-500 animate-pulse' :
-                  status.status === 'starting' ? 'bg-yellow-500 animate-pulse' :
-                  status.status === 'stopping' ? 'bg-orange-500 animate-pulse' :
-                  status.status === 'error' ? 'bg-red-500' :
-                  'bg-gray-500'
-                }`} />
-                <div className="flex flex-col">
-                  <span className="text-gray-200 font-medium">{status.name}</span>
-                  <span className={`text-xs ${
-                    status.status === 'running' ? 'text-green-400' :
-                    status.status === 'starting' ? 'text-yellow-400' :
-                    status.status === 'stopping' ? 'text-orange-400' :
-                    status.status === 'error' ? 'text-red-400' :
-                    'text-gray-500'
-                  }`}>
-                    {status.status === 'starting' ? 'Starting...' :
-                     status.status === 'running' ? 'Running' :
-                     status.status === 'stopping' ? 'Stopping...' :
-                     status.status === 'error' ? (status.message || 'Error') :
-                     'Idle'}
-                  </span>
+            {activeProcesses.map(([key, status]) => {
+              const styles = STATUS_STYLES[status.status];
+              return (
+                <div key={key} className="flex items-center space-x-3">
+                  <div className={`w-3 h-3 rounded-full ${styles.dot}`} />
+                  <div className="flex flex-col">
+                    <span className="text-gray-200 font-medium">{status.name}</span>
+                    <span className={`text-xs ${styles.text}`}>
+                      {status.status === 'error' ? (status.message || styles.label) : styles.label}
+                    </span>
+                  </div>
                 </div>
-              </div>
-            ))}
+              );
+            })}
           </div>
           
           {activeProcesses.length > 0 && (
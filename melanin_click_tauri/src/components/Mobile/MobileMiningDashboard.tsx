@@ -52,8 +52,16 @@ export default function MobileMiningDashboard() {
 
   useEffect(() => {
     loadMobileStats()
-    const interval = setInterval(loadMobileStats, 5000) // Update every 5 seconds
-    return () => clearInterval(interval)
+    // Update every 5 seconds, pausing while the app is in the background
+    const refresh = () => {
+      if (!document.hidden) loadMobileStats()
+    }
+    const interval = setInterval(refresh, 5000)
+    document.addEventListener('visibilitychange', refresh)
+    return () => {
+      clearInterval(interval)
+      document.removeEventListener('visibilitychange', refresh)
+    }
   }, [])
 
   const loadMobileStats = async () => {
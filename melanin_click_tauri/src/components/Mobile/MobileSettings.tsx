@@ -30,9 +30,16 @@ export default function MobileSettings() {
     loadSettings()
     loadBatteryStatus()
     
-    // Set up periodic battery monitoring
-    const interval = setInterval(loadBatteryStatus, 30000) // Every 30 seconds
-    return () => clearInterval(interval)
+    // Set up periodic battery monitoring, paused while in the background
+    const refresh = () => {
+      if (!document.hidden) loadBatteryStatus()
+    }
+    const interval = setInterval(refresh, 30000) // Every 30 seconds
+    document.addEventListener('visibilitychange', refresh)
+    return () => {
+      clearInterval(interval)
+      document.removeEventListener('visibilitychange', refresh)
+    }
   }, [])
 
   const loadSettings = async () => {
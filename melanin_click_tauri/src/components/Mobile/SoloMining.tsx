@@ -54,8 +54,16 @@ export default function SoloMining() {
 
   useEffect(() => {
     loadStats()
-    const interval = setInterval(loadStats, 10000) // Update every 10 seconds
-    return () => clearInterval(interval)
+    // Update every 10 seconds, pausing while the app is in the background
+    const refresh = () => {
+      if (!document.hidden) loadStats()
+    }
+    const interval = setInterval(refresh, 10000)
+    document.addEventListener('visibilitychange', refresh)
+    return () => {
+      clearInterval(interval)
+      document.removeEventListener('visibilitychange', refresh)
+    }
   }, [])
 
   const loadStats = async () => {
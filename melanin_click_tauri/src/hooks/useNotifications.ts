@@ -1,6 +1,11 @@
 import { useState, useCallback } from 'react';
 import { Notification } from '../types';
 
+// Monotonic id source: Date.now() collides when a burst of notifications
+// lands in the same millisecond, and the expiry timer for one would then
+// silently remove the others.
+let nextNotificationId = 0;
+
 export const useNotifications = () => {
   const [notifications, setNotifications] = useState<Notification[]>([]);
 
@@ -11,7 +16,7 @@ export const useNotifications = () => {
     duration = 5000
   ) => {
     const notification: Notification = {
-      id: Date.now().toString(),
+      id: (nextNotificationId++).toString(),
       type,
       title,
       message,
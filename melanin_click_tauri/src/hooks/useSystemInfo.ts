@@ -4,7 +4,10 @@ import { SystemInfo, CryptoConfig, HardwareInfo } from '../types';
 
 export const useSystemInfo = () => {
   const [systemInfo, setSystemInfo] = useState<SystemInfo | null>(null);
-  const [cryptoConfig, setCryptoConfig] = useState<CryptoConfig | null>(null);
+  // No get_crypto_config command exists in the backend; the invoke failed on
+  // every mount, burning an IPC round-trip just to set the error banner.
+  // Kept as always-null state so consumers' fallbacks keep working.
+  const [cryptoConfig] = useState<CryptoConfig | null>(null);
   const [hardwareInfo, setHardwareInfo] = useState<HardwareInfo | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -19,16 +22,6 @@ export const useSystemInfo = () => {
     }
   };
 
-  const loadCryptoConfig = async () => {
-    try {
-      const config = await invoke<CryptoConfig>('get_crypto_config');
-      setCryptoConfig(config);
-    } catch (error) {
-      console.error('Failed to load crypto config:', error);
-      setError('Failed to load crypto configuration');
-    }
-  };
-
   const loadHardwareInfo = async () => {
     try {
       const info = await invoke<HardwareInfo>('get_hardware_info');
@@ -45,7 +38,6 @@ export const useSystemInfo = () => {
     try {
       await Promise.all([
         loadSystemInfo(),
-        loadCryptoConfig(),
         loadHardwareInfo()
       ]);
     } catch (error) {
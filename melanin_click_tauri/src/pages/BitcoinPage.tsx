@@ -1,6 +1,7 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { TauriService } from '../services/tauri';
 import { useNotifications } from '../hooks/useNotifications';
+import { MiningStats } from '../types';
 import { Play, Square, Download, Activity, Zap, Monitor, HardDrive, Cpu } from 'lucide-react';
 import MiningRiskWarning from '../components/Common/MiningRiskWarning';
 
@@ -20,7 +21,7 @@ const BitcoinPage: React.FC = () => {
   const [miningMode, setMiningMode] = useState<'cpu' | 'stick'>('cpu');
   const [threads, setThreads] = useState(1);
   const [isMining, setIsMining] = useState(false);
-  const [miningStats, setMiningStats] = useState<any>(null);
+  const [miningStats, setMiningStats] = useState<MiningStats | null>(null);
   
   // Available pools with enhanced information
   const [availablePools, setAvailablePools] = useState<any[]>([]);
@@ -34,19 +35,34 @@ const BitcoinPage: React.FC = () => {
   const [showRiskWarning, setShowRiskWarning] = useState(false);
   const [hasAcceptedRisks, setHasAcceptedRisks] = useState(false);
 
+  // Read the running flags through refs inside the poller so the interval
+  // and visibility listener are installed once per mount instead of being
+  // torn down and recreated every time a flag flips.
+  const isNodeRunningRef = useRef(isNodeRunning);
+  isNodeRunningRef.current = isNodeRunning;
+  const isMiningRef = useRef(isMining);
+  isMiningRef.current = isMining;
+
   useEffect(() => {
     loadMiningPools();
     checkNodeStatus();
     updateMiningStats();
     
-    // Set up periodic updates
-    const interval = setInterval(() => {
-      if (isNodeRunning) checkNodeStatus();
-      if (isMining) updateMiningStats();
-    }, 10000);
-    
-    return () => clearInterval(interval);
-  }, [isNodeRunning, isMining]);
+    // Set up periodic updates; skip ticks while the window is hidden and
+    // refresh as soon as it becomes visible again
+    const refresh = () => {
+      if (document.hidden) return;
+      if (isNodeRunningRef.current) checkNodeStatus();
+      if (isMiningRef.current) updateMiningStats();
+    };
+    const interval = setInterval(refresh, 10000);
+    document.addEventListener('visibilitychange', refresh);
+
+    return () => {
+      clearInterval(interval);
+      document.removeEventListener('visibilitychange', refresh);
+    };
+  }, []);
 
   const loadMiningPools = async () => {
     try {
@@ -76,7 +92,11 @@ const BitcoinPage: React.FC = () => {
   const updateMiningStats = async () => {
     try {
       const stats = await TauriService.getMiningStatus('bitcoin');
-      setMiningStats(stats);
+      // Keep the previous object when nothing changed so an idle poll tick
+      // doesn't re-render the whole page.
+      setMiningStats((prev) =>
+        prev && JSON.stringify(prev) === JSON.stringify(stats) ? prev : stats
+      );
     } catch (error) {
       console.error('Failed to update mining stats:', error);
     }
@@ -85,7 +105,29 @@ const BitcoinPage: React.FC = () => {
   const handleDownloadBitcoin = async () => {
     setIsDownloading(true);
     setDownloadProgress({ progress: 0, status: 'Starting download...' });
-    
+
+    // Poll backend progress while the install runs; only push a state update
+    // when the integer percentage moves so re-renders stay bounded.
+    let lastPercent = -1;
+    const progressInterval = setInterval(async () => {
+      try {
+        const downloads = await TauriService.getActiveDownloads();
+        // Match on the URL so a stale or concurrent download for another
+        // coin cannot drive this page's progress bar.
+        const active = downloads.find(
+          (d) => d.status === 'downloading' && d.url.includes('bitcoin')
+        );
+        if (!active || !active.total_size) return;
+        const percent = Math.floor((active.downloaded / active.total_size) * 100);
+        if (percent !== lastPercent) {
+          lastPercent = percent;
+          setDownloadProgress({ progress: percent, status: 'Downloading Bitcoin Core...' });
+        }
+      } catch {
+        // Polling is best-effort; failures surface via the install promise
+      }
+    }, 500);
+
     try {
       addNotification('info', 'Bitcoin Core Download', 'Starting Bitcoin Core download...');
 
@@ -103,6 +145,7 @@ const BitcoinPage: React.FC = () => {
       addNotification('error', 'Download Failed', error as string);
       setDownloadProgress(null);
     } finally {
+      clearInterval(progressInterval);
       setIsDownloading(false);
     }
   };
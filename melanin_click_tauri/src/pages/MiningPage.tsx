@@ -4,6 +4,14 @@ import { TauriService } from '../services/tauri';
 import { useNotifications } from '../hooks/useNotifications';
 import { MiningStats } from '../types';
 
+// Static pool list; defined at module scope so it is built once instead of
+// on every render.
+const miningPools = [
+  { name: 'Whive Pool', url: 'stratum+tcp://pool.whive.io:3333', fee: '1%', location: 'Global' },
+  { name: 'Mining Pool Hub', url: 'stratum+tcp://hub.miningpoolhub.com:20569', fee: '0.9%', location: 'US/EU/Asia' },
+  { name: 'Suprnova', url: 'stratum+tcp://whive.suprnova.cc:7777', fee: '1%', location: 'Global' },
+];
+
 const MiningPage: React.FC = () => {
   const [activeMiner, setActiveMiner] = useState<'none' | 'bitcoin' | 'whive'>('none');
   const [showPoolSettings, setShowPoolSettings] = useState(false);
@@ -17,8 +25,16 @@ const MiningPage: React.FC = () => {
 
   useEffect(() => {
     if (activeMiner !== 'none') {
-      const interval = setInterval(updateMiningStats, 5000);
-      return () => clearInterval(interval);
+      // Skip ticks while the window is hidden; refresh on return to visible
+      const refresh = () => {
+        if (!document.hidden) updateMiningStats();
+      };
+      const interval = setInterval(refresh, 5000);
+      document.addEventListener('visibilitychange', refresh);
+      return () => {
+        clearInterval(interval);
+        document.removeEventListener('visibilitychange', refresh);
+      };
     }
   }, [activeMiner]);
 
@@ -26,7 +42,11 @@ const MiningPage: React.FC = () => {
     try {
       const miningType = activeMiner === 'bitcoin' ? 'bitcoin' : 'whive';
       const stats = await TauriService.getRealMiningStats(miningType);
-      setMiningStats(stats);
+      // Keep the previous object when nothing changed so an idle miner's
+      // poll tick doesn't re-render the whole page.
+      setMiningStats(prev =>
+        prev && JSON.stringify(prev) === JSON.stringify(stats) ? prev : stats
+      );
     } catch (error) {
       console.error('Failed to update mining stats:', error);
     }
@@ -111,12 +131,6 @@ const MiningPage: React.FC = () => {
     }
   };
 
-  const miningPools = [
-    { name: 'Whive Pool', url: 'stratum+tcp://pool.whive.io:3333', fee: '1%', location: 'Global' },
-    { name: 'Mining Pool Hub', url: 'stratum+tcp://hub.miningpoolhub.com:20569', fee: '0.9%', location: 'US/EU/Asia' },
-    { name: 'Suprnova', url: 'stratum+tcp://whive.suprnova.cc:7777', fee: '1%', location: 'Global' },
-  ];
-
   return (
     <div className="container mx-auto px-6 py-8 space-y-8">
       {/* Header */}
@@ -1,6 +1,7 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { TauriService } from '../services/tauri';
 import { useNotifications } from '../hooks/useNotifications';
+import { MiningStats } from '../types';
 import { Play, Square, Download, Activity, Zap, Monitor, HardDrive, Cpu } from 'lucide-react';
 import MiningRiskWarning from '../components/Common/MiningRiskWarning';
 
@@ -17,7 +18,7 @@ const WhivePage: React.FC = () => {
   const [threads, setThreads] = useState(2); // Changed from 4 to 2 to match example
   const [intensity, setIntensity] = useState(85);
   const [isMining, setIsMining] = useState(false);
-  const [miningStats, setMiningStats] = useState<any>(null);
+  const [miningStats, setMiningStats] = useState<MiningStats | null>(null);
   
   // Loading states
   const [isDownloading, setIsDownloading] = useState(false);
@@ -28,18 +29,33 @@ const WhivePage: React.FC = () => {
   const [showRiskWarning, setShowRiskWarning] = useState(false);
   const [hasAcceptedRisks, setHasAcceptedRisks] = useState(false);
 
+  // Read the running flags through refs inside the poller so the interval
+  // and visibility listener are installed once per mount instead of being
+  // torn down and recreated every time a flag flips.
+  const isNodeRunningRef = useRef(isNodeRunning);
+  isNodeRunningRef.current = isNodeRunning;
+  const isMiningRef = useRef(isMining);
+  isMiningRef.current = isMining;
+
   useEffect(() => {
     checkNodeStatus();
     updateMiningStats();
     
-    // Set up periodic updates
-    const interval = setInterval(() => {
-      if (isNodeRunning) checkNodeStatus();
-      if (isMining) updateMiningStats();
-    }, 10000);
-    
-    return () => clearInterval(interval);
-  }, [isNodeRunning, isMining]);
+    // Set up periodic updates; skip ticks while the window is hidden and
+    // refresh as soon as it becomes visible again
+    const refresh = () => {
+      if (document.hidden) return;
+      if (isNodeRunningRef.current) checkNodeStatus();
+      if (isMiningRef.current) updateMiningStats();
+    };
+    const interval = setInterval(refresh, 10000);
+    document.addEventListener('visibilitychange', refresh);
+
+    return () => {
+      clearInterval(interval);
+      document.removeEventListener('visibilitychange', refresh);
+    };
+  }, []);
 
   const checkNodeStatus = async () => {
     try {
@@ -59,7 +75,11 @@ const WhivePage: React.FC = () => {
   const updateMiningStats = async () => {
     try {
       const stats = await TauriService.getMiningStatus('whive');
-      setMiningStats(stats);
+      // Keep the previous object when nothing changed so an idle poll tick
+      // doesn't re-render the whole page.
+      setMiningStats((prev) =>
+        prev && JSON.stringify(prev) === JSON.stringify(stats) ? prev : stats
+      );
     } catch (error) {
       console.error('Failed to update mining stats:', error);
     }
@@ -68,7 +88,29 @@ const WhivePage: React.FC = () => {
   const handleDownloadWhive = async () => {
     setIsDownloading(true);
     setDownloadProgress({ progress: 0, status: 'Starting download...' });
-    
+
+    // Poll backend progress while the install runs; only push a state update
+    // when the integer percentage moves so re-renders stay bounded.
+    let lastPercent = -1;
+    const progressInterval = setInterval(async () => {
+      try {
+        const downloads = await TauriService.getActiveDownloads();
+        // Match on the URL so a stale or concurrent download for another
+        // coin cannot drive this page's progress bar.
+        const active = downloads.find(
+          (d) => d.status === 'downloading' && d.url.includes('whive')
+        );
+        if (!active || !active.total_size) return;
+        const percent = Math.floor((active.downloaded / active.total_size) * 100);
+        if (percent !== lastPercent) {
+          lastPercent = percent;
+          setDownloadProgress({ progress: percent, status: 'Downloading Whive Core...' });
+        }
+      } catch {
+        // Polling is best-effort; failures surface via the install promise
+      }
+    }, 500);
+
     try {
       addNotification('info', 'Whive Core Download', 'Starting Whive Core download...');
 
@@ -86,6 +128,7 @@ const WhivePage: React.FC = () => {
       addNotification('error', 'Download Failed', error as string);
       setDownloadProgress(null);
     } finally {
+      clearInterval(progressInterval);
       setIsDownloading(false);
     }
   };
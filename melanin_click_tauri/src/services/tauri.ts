@@ -36,6 +36,16 @@ interface NodeStatus {
   config_path: string;
 }
 
+// Mirrors DownloadProgress in src-tauri/src/lib.rs
+interface DownloadProgress {
+  total_size: number;
+  downloaded: number;
+  speed: number;
+  status: string;
+  url: string;
+  started_at: string;
+}
+
 interface MiningPool {
   name: string;
   url: string;
@@ -183,7 +193,11 @@ export class TauriService {
     return await invoke('check_file_exists', { path });
   }
 
-  static async getDownloadProgress(url: string): Promise<any> {
+  static async getDownloadProgress(url: string): Promise<DownloadProgress | null> {
     return await invoke('get_download_progress', { url });
   }
+
+  static async getActiveDownloads(): Promise<DownloadProgress[]> {
+    return await invoke('get_active_downloads');
+  }
 } 
\ No newline at end of file